@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""
+Implementations of famous algorithms, following the Stanford Algorithms
+Specialization https://www.coursera.org/specializations/algorithms
+
+Modules:
+    elements:
+        Element class to be used in heaps or other sorting algorithms.
+    heaps:
+        Heap classes (binary, d-ary, key-ordered, indexed and pairing heaps)
+        and a bucket queue.
+    readers:
+        Streaming readers for numeric input files.
+    graphs:
+        Graph algorithms (shortest paths, minimum spanning trees,
+        strongly connected components).
+
+A package written by Oliver Kroneisen, oliver@kroneisen.net
+"""
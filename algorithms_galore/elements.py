@@ -12,6 +12,8 @@ class elem:
     
     The attributes of this class are not protected to make handling the
     elements easier, i.e. no setter / getter methods are needed.
+    They are declared as slots, so that the elements need no per-instance
+    dictionary, which saves memory for large graphs.
 
     Arguments:
         key (int):
@@ -26,6 +28,8 @@ class elem:
             Reference to the key of another element (optional).
     """
 
+    __slots__ = ('key', 'val', 'idx', 'ref')
+
     def __init__(self, key, val, idx, ref=-1):
         """
         Initialize element.
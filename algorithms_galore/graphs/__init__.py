@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+"""
+Graph algorithms.
+
+Modules:
+    ch:
+        Contraction hierarchies for repeated shortest path queries.
+    csr:
+        Graph class in compressed sparse row (CSR) format.
+    dijkstra:
+        Dijkstra's algorithm for shortest paths with non-negative weights.
+    kruskal:
+        Kruskal's algorithm for minimum spanning trees.
+    prim:
+        Prim's algorithm for minimum spanning trees.
+    scc:
+        Kosaraju's and Tarjan's algorithms for strongly connected
+        components.
+
+A package written by Oliver Kroneisen, oliver@kroneisen.net
+"""
@@ -0,0 +1,540 @@
+# -*- coding: utf-8 -*-
+"""
+Contraction hierarchies for repeated shortest path queries in a directed
+graph with only non-negative arc weights, to be used as an imported module.
+
+The preprocessing contracts the nodes one by one in the order of their
+importance. When a node v is contracted, a shortcut arc u -> x with the
+length of u -> v -> x is added for every pair of remaining neighbours u, x,
+unless a witness path u -> x avoiding v is at most as long. The rank of
+a node is its position in the contraction order.
+A shortest path from s to t then always consists of an upward part from
+s and a downward part to t with respect to the ranks, so that a query is
+a bidirectional Dijkstra search, which only follows arcs to nodes of
+higher rank in both directions and settles only a small part of the graph.
+
+The hierarchy can be written to a binary file, which consists of a header
+and the arrays of the upward and downward graphs, and loaded from it via
+mmap without copying the arrays.
+
+A method collection for Stanford Algorithms Specialization 2 written
+by Oliver Kroneisen, oliver@kroneisen.net
+"""
+
+from array import array
+from bisect import bisect_left
+from itertools import repeat
+import math
+import mmap
+import os
+import struct
+import sys
+from algorithms_galore import heaps as ht
+from algorithms_galore.graphs import csr as cs
+
+global MAGIC   # identifier of binary hierarchy files, including byte order
+MAGIC = b'AGCH001' + (b'<' if sys.byteorder == 'little' else b'>')
+global HEADER   # magic, n, arcs up, arcs down, weight typecode, mtime, size
+HEADER = struct.Struct('=8sqqqc7xqq')
+
+class hierarchy:
+    """
+    Class for contraction hierarchy of a directed graph.
+
+    The upward graph up holds the arcs u -> x with rank[u] < rank[x], the
+    downward graph down holds the arcs u -> x with rank[u] > rank[x]
+    reversed, i.e. as x -> u, so that both searches of a query only follow
+    arcs to nodes of higher rank. Both graphs use the node ids and keys of
+    the original graph. The arrays up_mid and down_mid hold for every arc
+    the id of the contracted node v of a shortcut u -> v -> x, or -1 for
+    an original arc.
+
+    Arguments:
+        rank (array):
+            Array of n ranks, i.e. positions in the contraction order.
+        up (csr):
+            Upward graph in CSR format.
+        up_mid (array):
+            Array of middle node ids of the arcs of up.
+        down (csr):
+            Reversed downward graph in CSR format.
+        down_mid (array):
+            Array of middle node ids of the arcs of down.
+    """
+
+    def __init__(self, rank, up, up_mid, down, down_mid):
+        """
+        Initialize hierarchy.
+
+        Arguments:
+            rank (array):
+                Array of n ranks, i.e. positions in the contraction order.
+            up (csr):
+                Upward graph in CSR format.
+            up_mid (array):
+                Array of middle node ids of the arcs of up.
+            down (csr):
+                Reversed downward graph in CSR format.
+            down_mid (array):
+                Array of middle node ids of the arcs of down.
+        """
+
+        self.n = len(rank)   # number of nodes
+        self.rank = rank
+        self.up = up
+        self.up_mid = up_mid
+        self.down = down
+        self.down_mid = down_mid
+        self.keys = up.keys
+        return
+
+    def __str__(self):
+        """
+        Convert hierarchy content to string.
+
+        Returns:
+            text (str):
+                Content of hierarchy converted to a string.
+        """
+
+        text = 'Contraction hierarchy: ' + str(self.n) + ' nodes, ' \
+               + str(self.up.m) + ' arcs up, ' + str(self.down.m) \
+               + ' arcs down'
+        return text
+
+    def __repr__(self):
+        """
+        Represent hierarchy as a string.
+
+        Returns:
+            text (str):
+                Representation of hierarchy.
+        """
+
+        return str(self)
+
+    def __len__(self):
+        """
+        Number of nodes of the hierarchy.
+
+        Returns:
+            n (int):
+                Number of nodes.
+        """
+
+        return self.n
+
+    def index(self, key):
+        """
+        Return the id of the node with key.
+
+        Arguments:
+            key (int):
+                Key of node.
+
+        Returns:
+            i (int):
+                Id of node.
+        """
+
+        return self.up.index(key)
+
+    def query(self, s, t, unpack=True):
+        """
+        Calculate the shortest path from node s to node t by bidirectional
+        Dijkstra on the hierarchy, i.e. a forward search from s on the
+        upward graph and a backward search from t on the reversed downward
+        graph.
+
+        Both searches are advanced alternately. A search is finished as
+        soon as its queue is empty or the distance of its next node is at
+        least the length mu of the best path found so far, since it only
+        reaches nodes of higher rank, which is not monotone in the
+        distance.
+
+        Arguments:
+            s (int):
+                Id of start node.
+            t (int):
+                Id of target node.
+            unpack (bool):
+                Optional flag defining whether the shortcuts on the path
+                shall be replaced by the original arcs (= default),
+                otherwise the path is empty.
+
+        Returns:
+            d (float):
+                Shortest path distance from s to t, math.inf if t is not
+                reachable.
+            path (list):
+                Node ids on the shortest path from s to t, empty if t is
+                not reachable or unpack is 'False'.
+        """
+
+        if s == t:
+            return 0.0, [s]
+        graphs = (self.up, self.down)
+        dist = ({s: 0}, {t: 0})     # distances of forward and backward search
+        pred = ({s: -1}, {t: -1})   # arc index leading to node
+        tail = ({}, {})             # tail node of this arc
+        h = (ht.heap([(0, s)]), ht.heap([(0, t)]))
+        mu, meet = math.inf, -1     # length of best path and meeting node
+        d = 1
+        while h[0].e or h[1].e:
+            # Alternate between the searches, unless one is finished.
+            if h[1 - d].e:
+                d = 1 - d
+            dw, w = h[d].deletem()
+            dist_d = dist[d]
+            if dw > dist_d[w]:
+                # Outdated entry, node w has already been processed.
+                continue
+            if dw >= mu:   # no shorter path via this search
+                h[d].e.clear()
+                continue
+            offsets, heads, weights = \
+                graphs[d].offsets, graphs[d].targets, graphs[d].weights
+            dist_o, pred_d, tail_d = dist[1 - d], pred[d], tail[d]
+            for k in range(offsets[w], offsets[w + 1]):   # arcs of node w
+                u = heads[k]           # head of arc k
+                d2 = dw + weights[k]   # distance of u via w
+                if d2 < dist_d.get(u, math.inf):
+                    dist_d[u] = d2
+                    pred_d[u] = k
+                    tail_d[u] = w
+                    h[d].insert((d2, u))
+                    # Check for a shorter path via u.
+                    if u in dist_o and d2 + dist_o[u] < mu:
+                        mu, meet = d2 + dist_o[u], u
+        if meet < 0:
+            return math.inf, []
+        mu = float(mu)   # same type for integer and float weights
+        if not unpack:
+            return mu, []
+        # Join forward path s -> meet and backward path meet -> t.
+        path = [s]
+        arcs = []
+        u = meet
+        while u != s:
+            arcs.append(pred[0][u])
+            u = tail[0][u]
+        for k in reversed(arcs):
+            self.unpack(self.up.targets[k], self.up_mid[k], path)
+        u = meet
+        while u != t:
+            k = pred[1][u]
+            u = tail[1][u]
+            self.unpack(u, self.down_mid[k], path)
+        return mu, path
+
+    def unpack(self, x, v, path):
+        """
+        Append the original path of an arc from path[-1] to x with middle
+        node v to path, by recursively replacing the shortcuts
+        path[-1] -> v -> x with their arcs.
+
+        Arguments:
+            x (int):
+                Id of head node of the arc.
+            v (int):
+                Id of middle node of the arc, -1 for an original arc.
+            path (list):
+                Path of node ids, ending at the tail node of the arc.
+
+        Returns:
+            path (list):
+                Path extended up to x.
+        """
+
+        up, down = self.up, self.down
+        stack = [(x, v)]
+        while stack:
+            x, v = stack.pop()
+            if v < 0:
+                path.append(x)
+                continue
+            # The middle node v has a lower rank than both ends, so the
+            # arc u -> v is stored reversed at v in down and the arc
+            # v -> x at v in up.
+            u = path[-1]
+            a, b = down.offsets[v], down.offsets[v + 1]
+            k1 = a + list(down.targets[a:b]).index(u)
+            a, b = up.offsets[v], up.offsets[v + 1]
+            k2 = a + list(up.targets[a:b]).index(x)
+            stack.append((x, self.up_mid[k2]))
+            stack.append((v, self.down_mid[k1]))
+        return path
+
+def witness(out, u, v, dmax, targets, limit):
+    """
+    Search witness paths from node u avoiding node v by a Dijkstra search,
+    which stops at distance dmax, after all targets are settled or after
+    limit settled nodes.
+
+    Arguments:
+        out (list):
+            Remaining arcs per node as dictionaries, matching the head node
+            id to the tuple (weight, middle node id).
+        u (int):
+            Id of start node.
+        v (int):
+            Id of node to be avoided.
+        dmax (float):
+            Maximum distance of interest.
+        targets (dict):
+            Target nodes, i.e. heads of the arcs of v.
+        limit (int):
+            Maximum number of settled nodes.
+
+    Returns:
+        dist (dict):
+            Upper bounds of the distances from u for the reached nodes.
+    """
+
+    dist = {u: 0}
+    done = set()   # settled nodes
+    remaining = len(targets)   # targets not settled yet
+    h = ht.heap([(0, u)])
+    while h.e and len(done) < limit:
+        dw, w = h.deletem()
+        if dw > dmax:
+            break
+        if w in done:
+            continue
+        done.add(w)
+        if w in targets:
+            remaining -= 1
+            if not remaining:
+                break
+        for x, (c, _) in out[w].items():
+            d2 = dw + c
+            if x != v and d2 <= dmax and d2 < dist.get(x, math.inf):
+                dist[x] = d2
+                h.insert((d2, x))
+    return dist
+
+def shortcuts(out, inn, v, limit):
+    """
+    Find the shortcuts needed for contracting node v.
+
+    Arguments:
+        out (list):
+            Remaining arcs per node as dictionaries, matching the head node
+            id to the tuple (weight, middle node id).
+        inn (list):
+            Remaining reversed arcs per node, i.e. matching the tail node
+            id to the tuple (weight, middle node id).
+        v (int):
+            Id of node to be contracted.
+        limit (int):
+            Maximum number of settled nodes per witness search.
+
+    Returns:
+        sc (list):
+            List of shortcuts as tuples (tail id, head id, weight).
+    """
+
+    sc = []
+    if not out[v]:
+        return sc
+    cmax = max(c for c, _ in out[v].values())
+    for u, (c1, _) in inn[v].items():
+        dist = witness(out, u, v, c1 + cmax, out[v], limit)
+        for x, (c2, _) in out[v].items():
+            if x != u and dist.get(x, math.inf) > c1 + c2:
+                sc.append((u, x, c1 + c2))
+    return sc
+
+def contract(g, limit=64):
+    """
+    Build the contraction hierarchy of a directed graph in CSR format with
+    non-negative arc weights.
+
+    The node to be contracted next is the one with the smallest edge
+    difference, i.e. number of shortcuts minus number of removed arcs, plus
+    the number of already contracted neighbours, which spreads the
+    contraction evenly over the graph. The priorities are updated lazily:
+    the priority of the node taken from the queue is recalculated, and the
+    node is put back if it is no longer the minimum. The priorities of the
+    neighbours of a contracted node are recalculated immediately.
+
+    Arguments:
+        g (csr):
+            Graph in CSR format with arc weights.
+        limit (int):
+            Optional maximum number of settled nodes per witness search.
+            Smaller limits speed up the preprocessing, but may add
+            unnecessary shortcuts.
+
+    Returns:
+        c (hierarchy):
+            Contraction hierarchy of g.
+    """
+
+    if g.weights is None:
+        msg = 'Error in contract: Graph without arc weights.'
+        raise ValueError(msg)
+    n = g.n
+    # Remaining graph, parallel arcs are reduced to the shortest one.
+    out = [{} for _ in range(n)]
+    inn = [{} for _ in range(n)]
+    offsets, heads, weights = g.offsets, g.targets, g.weights
+    for u in range(n):
+        out_u = out[u]
+        for k in range(offsets[u], offsets[u + 1]):
+            x, c = heads[k], weights[k]
+            if x != u and c < out_u.get(x, (math.inf,))[0]:
+                out_u[x] = inn[x][u] = (c, -1)
+    deleted = array('q', [0]) * n   # number of contracted neighbours
+
+    def priority(v):
+        sc = shortcuts(out, inn, v, limit)
+        p = len(sc) - len(out[v]) - len(inn[v]) + deleted[v]
+        return p, sc
+
+    q = ht.iheap(n)
+    for v in range(n):
+        q.insert(v, priority(v)[0])
+    rank = array('q', [0]) * n
+    up = ([], [], [], [])     # tails, heads, weights, middle nodes
+    down = ([], [], [], [])
+    r = 0
+    while len(q):
+        v, _ = q.deletem()
+        p, sc = priority(v)
+        if len(q) and p > q.keys[q.h[0]]:
+            # Lazy update, v is no longer the minimum.
+            q.insert(v, p)
+            continue
+        rank[v] = r
+        r += 1
+        # Remaining arcs of v lead to nodes of higher rank.
+        for x, (c, mid) in out[v].items():
+            for a, y in zip(up, (v, x, c, mid)):
+                a.append(y)
+            del inn[x][v]
+            deleted[x] += 1
+        for u, (c, mid) in inn[v].items():
+            for a, y in zip(down, (v, u, c, mid)):
+                a.append(y)
+            del out[u][v]
+            deleted[u] += 1
+        neighbours = set(out[v])
+        neighbours.update(inn[v])
+        out[v], inn[v] = {}, {}
+        for u, x, c in sc:
+            if c < out[u].get(x, (math.inf,))[0]:
+                out[u][x] = inn[x][u] = (c, v)
+        for u in neighbours:
+            p = priority(u)[0]
+            if p < q.keys[u]:
+                q.decrease_key(u, p)
+            elif p > q.keys[u]:
+                q.increase_key(u, p)
+    graphs = []
+    for tails, heads, weights, mids in (up, down):
+        order = sorted(range(len(tails)), key=tails.__getitem__)
+        tails = array('q', map(tails.__getitem__, order))
+        heads = array('q', map(heads.__getitem__, order))
+        weights = array(g.wtype, map(weights.__getitem__, order))
+        mids = array('q', map(mids.__getitem__, order))
+        offsets = array('q', map(bisect_left, repeat(tails), range(n + 1)))
+        graphs.append(cs.csr(offsets, heads, weights, g.keys))
+        graphs.append(mids)
+    return hierarchy(rank, *graphs)
+
+def write_ch(c, file_name, source=None):
+    """
+    Write hierarchy to binary file, which can be loaded by load_ch.
+    The file is written to a temporary file first and then renamed, so that
+    a concurrent load never sees an incomplete file.
+
+    Arguments:
+        c (hierarchy):
+            Contraction hierarchy.
+        file_name (str):
+            File name for the hierarchy to be written.
+        source (str):
+            Optional name of the source file the graph was read from, whose
+            modification time and size are stored in the header.
+
+    Returns:
+        err (int):
+            Indicator 0 for success and 1 for errors.
+    """
+
+    global MAGIC, HEADER
+    mtime, size = 0, 0
+    tmp_name = file_name + '.tmp' + str(os.getpid())
+    try:
+        if source is not None:
+            st = os.stat(source)
+            mtime, size = st.st_mtime_ns, st.st_size
+        with open(tmp_name, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, c.n, c.up.m, c.down.m,
+                                c.up.wtype.encode(), mtime, size))
+            f.write(c.keys)
+            f.write(c.rank)
+            for g, mids in ((c.up, c.up_mid), (c.down, c.down_mid)):
+                f.write(g.offsets)
+                f.write(g.targets)
+                f.write(g.weights)
+                f.write(mids)
+        os.replace(tmp_name, file_name)
+        return 0
+    except:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        return 1
+
+def load_ch(file_name, source=None):
+    """
+    Load hierarchy from binary file via mmap. The arrays of the hierarchy
+    are read-only memoryviews of the mapped file, i.e. nothing is copied and
+    the pages are shared by all processes loading the same file.
+
+    Arguments:
+        file_name (str):
+            File name of the hierarchy written by write_ch.
+        source (str):
+            Optional name of the source file, the hierarchy is only loaded
+            if the modification time and size of the source file match the
+            header.
+
+    Returns:
+        c (hierarchy):
+            Contraction hierarchy, 'None' if the file is missing, invalid or
+            outdated.
+    """
+
+    global MAGIC, HEADER
+    try:
+        with open(file_name, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n, m_up, m_down, wtype, mtime, size = HEADER.unpack_from(mm)
+        if magic != MAGIC:
+            return None
+        if source is not None:
+            st = os.stat(source)
+            if (mtime, size) != (st.st_mtime_ns, st.st_size):
+                return None
+        # Cut arrays from the mapped file, all items have 8 bytes.
+        wtype = wtype.decode()
+        sections = [(n, 'q'), (n, 'q'),
+                    (n + 1, 'q'), (m_up, 'q'), (m_up, wtype), (m_up, 'q'),
+                    (n + 1, 'q'), (m_down, 'q'), (m_down, wtype),
+                    (m_down, 'q')]
+        if len(mm) != HEADER.size + 8*sum(k for k, _ in sections):
+            return None
+        mv = memoryview(mm)
+        arrays = []
+        a = HEADER.size
+        for k, typecode in sections:
+            arrays.append(mv[a:a + 8*k].cast(typecode))
+            a += 8*k
+        keys, rank = arrays[0:2]
+        up = cs.csr(*arrays[2:5], keys)
+        down = cs.csr(*arrays[6:9], keys)
+        return hierarchy(rank, up, arrays[5], down, arrays[9])
+    except:
+        return None
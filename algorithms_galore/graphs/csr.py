@@ -0,0 +1,473 @@
+# -*- coding: utf-8 -*-
+"""
+Graph class in compressed sparse row (CSR) format to be used as an imported
+module.
+
+Graphs can be written to a binary file, which consists of a header and the
+arrays keys, offsets, targets and weights, and loaded from it via mmap
+without copying the arrays.
+
+A method collection for Stanford Algorithms Specialization 2 written
+by Oliver Kroneisen, oliver@kroneisen.net
+"""
+
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from itertools import accumulate, chain, islice, repeat
+from operator import le, sub
+import mmap
+import os
+import struct
+import sys
+
+global MAGIC   # identifier of binary CSR files, including byte order
+MAGIC = b'AGCSR01' + (b'<' if sys.byteorder == 'little' else b'>')
+global HEADER   # magic, n, m, weight typecode, source mtime, source size
+HEADER = struct.Struct('=8sqqc7xqq')
+
+class csr:
+    """
+    Class for directed graph in compressed sparse row (CSR) format.
+
+    The nodes are numbered by ids 0, ..., n - 1. The arcs leaving node i
+    are stored at the positions offsets[i], ..., offsets[i + 1] - 1 of the
+    arrays targets (head node ids) and weights (arc weights).
+    The original node keys are kept in ascending order in the array keys,
+    i.e. keys[i] is the key of node i.
+    An undirected graph is represented by storing every edge as two arcs.
+    Graphs loaded by load_csr hold read-only memoryviews instead of arrays.
+
+    Arguments:
+        offsets (array):
+            Array of n + 1 offsets into targets and weights.
+        targets (array):
+            Array of m head node ids.
+        weights (array):
+            Optional array of m arc weights, with value 'None' for
+            unweighted graphs.
+        keys (array):
+            Array of n node keys in ascending order.
+    """
+
+    def __init__(self, offsets, targets, weights, keys):
+        """
+        Initialize graph.
+
+        Arguments:
+            offsets (array):
+                Array of n + 1 offsets into targets and weights.
+            targets (array):
+                Array of m head node ids.
+            weights (array):
+                Optional array of m arc weights, with value 'None' for
+                unweighted graphs.
+            keys (array):
+                Array of n node keys in ascending order.
+        """
+
+        self.n = len(keys)      # number of nodes
+        self.m = len(targets)   # number of arcs
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.keys = keys
+        # Typecode of weights, arrays loaded via mmap are memoryviews.
+        self.wtype = None
+        if isinstance(weights, array):
+            self.wtype = weights.typecode
+        elif weights is not None:
+            self.wtype = weights.format
+        self.wrange = None   # cached minimum and maximum arc weight
+        return
+
+    def __str__(self):
+        """
+        Convert graph content to string.
+
+        Returns:
+            text (str):
+                Content of graph converted to a string.
+        """
+
+        text = 'CSR graph: ' + str(self.n) + ' nodes, ' + str(self.m) + ' arcs'
+        return text
+
+    def __repr__(self):
+        """
+        Represent graph as a string.
+
+        Returns:
+            text (str):
+                Representation of graph.
+        """
+
+        return str(self)
+
+    def __len__(self):
+        """
+        Number of nodes of the graph.
+
+        Returns:
+            n (int):
+                Number of nodes.
+        """
+
+        return self.n
+
+    def index(self, key):
+        """
+        Return the id of the node with key.
+
+        Arguments:
+            key (int):
+                Key of node.
+
+        Returns:
+            i (int):
+                Id of node.
+        """
+
+        i = bisect_left(self.keys, key)
+        if i == self.n or self.keys[i] != key:
+            msg = 'Error in index: No such node in graph.'
+            raise ValueError(msg)
+        return i
+
+    def arcs(self, i):
+        """
+        Return the arcs leaving node i.
+
+        Arguments:
+            i (int):
+                Id of node.
+
+        Returns:
+            arcs (list):
+                List of tuples (head id, weight), with weight 'None' for
+                unweighted graphs.
+        """
+
+        a, b = self.offsets[i], self.offsets[i + 1]
+        if self.weights is None:
+            return [(j, None) for j in self.targets[a:b]]
+        return list(zip(self.targets[a:b], self.weights[a:b]))
+
+    def weight_range(self):
+        """
+        Return the minimum and maximum arc weight, which are determined by
+        one scan over all arcs on the first call and cached for the
+        following calls.
+
+        Returns:
+            wmin (int or float):
+                Minimum arc weight, 0 for graphs without arcs.
+            wmax (int or float):
+                Maximum arc weight, 0 for graphs without arcs.
+        """
+
+        if self.weights is None:
+            msg = 'Error in weight_range: Graph without arc weights.'
+            raise ValueError(msg)
+        if self.wrange is None:
+            self.wrange = (min(self.weights, default=0),
+                           max(self.weights, default=0))
+        return self.wrange
+
+    def transpose(self):
+        """
+        Create the transposed graph, i.e. with all arcs reversed, by a
+        stable sort of the arcs by head node.
+
+        Returns:
+            g (csr):
+                Transposed graph with the same node ids.
+        """
+
+        offsets, targets, weights = _arrange(self.n, self.targets,
+                                             self.tails(), self.weights)
+        return csr(offsets, targets, weights, self.keys)
+
+    def tails(self):
+        """
+        Return the tail node ids of all arcs, i.e. the arcs of the graph are
+        (tails[k], targets[k]) for k = 0, ..., m - 1.
+
+        Returns:
+            tails (array):
+                Array of m tail node ids.
+        """
+
+        degrees = map(sub, self.offsets[1:], self.offsets)
+        tails = array('q', chain.from_iterable(
+            map(repeat, range(self.n), degrees)))
+        return tails
+
+def _arrange(n, tails, heads, weights):
+    """
+    Arrange arcs given by node ids in CSR format by a stable counting sort
+    by tail node, i.e. degree counts, their prefix sums as offsets and a
+    scatter of the arcs to their positions, which is skipped if the arcs
+    are already sorted.
+
+    Arguments:
+        n (int):
+            Number of nodes.
+        tails (array):
+            Tail node ids of the arcs.
+        heads (array):
+            Head node ids of the arcs.
+        weights (array):
+            Weights of the arcs, 'None' for unweighted graphs.
+
+    Returns:
+        offsets (array):
+            Array of n + 1 offsets into targets and weights.
+        targets (array):
+            Head node ids of the arcs sorted by tail node.
+        weights (array):
+            Weights of the arcs sorted by tail node.
+    """
+
+    # Offset of node i is the number of arcs of the nodes before i.
+    degrees = Counter(tails)
+    offsets = array('q', [0])
+    offsets.extend(accumulate(map(degrees.__getitem__, range(n))))
+    del degrees
+    if not all(map(le, tails, islice(tails, 1, None))):
+        # Scatter every arc to the next free position of its tail node.
+        pos = offsets[:-1]
+        targets = array('q', [0]) * len(heads)
+        if weights is None:
+            for u, v in zip(tails, heads):
+                p = pos[u]
+                pos[u] = p + 1
+                targets[p] = v
+        else:
+            typecode = getattr(weights, 'typecode', None) or weights.format
+            w = array(typecode, [0]) * len(weights)
+            for u, v, c in zip(tails, heads, weights):
+                p = pos[u]
+                pos[u] = p + 1
+                targets[p] = v
+                w[p] = c
+            weights = w
+        heads = targets
+    return offsets, heads, weights
+
+def csr_from_edges(tails, heads, weights=None, keys=None, undirected=False):
+    """
+    Create CSR graph from lists of arcs, given by the keys of their tail
+    and head nodes.
+
+    Arguments:
+        tails (list):
+            Keys of the tail nodes of the arcs.
+        heads (list):
+            Keys of the head nodes of the arcs.
+        weights (list):
+            Optional weights of the arcs, with value 'None' for
+            unweighted graphs.
+        keys (list):
+            Optional keys of all nodes, e.g. including isolated nodes.
+            In case of 'None', the nodes are the tail and head nodes.
+        undirected (bool):
+            Optional flag defining whether every arc shall be stored in both
+            directions, i.e. as an undirected edge.
+
+    Returns:
+        g (csr):
+            Graph in CSR format.
+    """
+
+    # Collect node keys and map them to ids in ascending order.
+    if keys is None:
+        keys = set(tails)
+        keys.update(heads)
+    keys = array('q', sorted(keys))
+    n = len(keys)
+    if n and keys[-1] - keys[0] == n - 1:
+        # Consecutive keys, the id is the offset to the smallest key.
+        k0 = repeat(keys[0])
+        tails = array('q', map(sub, tails, k0))
+        heads = array('q', map(sub, heads, k0))
+        lo = min(min(tails, default=0), min(heads, default=0))
+        hi = max(max(tails, default=0), max(heads, default=0))
+        if lo < 0 or hi >= n:
+            msg = 'Error in csr_from_edges: Arc with unknown node.'
+            raise ValueError(msg)
+    else:
+        ids = dict(zip(keys, range(n)))
+        tails = array('q', map(ids.__getitem__, tails))
+        heads = array('q', map(ids.__getitem__, heads))
+        del ids
+    if undirected:
+        tails, heads = tails + heads, heads + tails
+        if weights is not None:
+            weights = list(weights) * 2
+    if weights is not None:
+        typecode = 'q'
+        if isinstance(weights, array):
+            if weights.typecode in 'fd':
+                typecode = 'd'
+        else:
+            for x in weights:
+                if type(x) is not int:
+                    typecode = 'd'
+                    break
+        weights = array(typecode, weights)
+    offsets, targets, weights = _arrange(n, tails, heads, weights)
+    return csr(offsets, targets, weights, keys)
+
+def csr_from_dict(adj_dict, weighted=True):
+    """
+    Create CSR graph from a dictionary of adjacency lists, as created by
+    the read_list methods of the graph modules.
+
+    Arguments:
+        adj_dict (dict):
+            Dictionary of nodes, matching every node key to its adjacency
+            list, with entries [node, weight] for weighted graphs and
+            node for unweighted graphs.
+        weighted (bool):
+            Optional flag defining whether the adjacency lists contain
+            weights (= default).
+
+    Returns:
+        g (csr):
+            Graph in CSR format.
+    """
+
+    tails, heads = [], []
+    weights = [] if weighted else None
+    for tail, adj_list in adj_dict.items():
+        for e in adj_list:
+            tails.append(tail)
+            if weighted:
+                heads.append(e[0])
+                weights.append(e[1])
+            else:
+                heads.append(e)
+    return csr_from_edges(tails, heads, weights, keys=adj_dict.keys())
+
+def write_csr(g, file_name, source=None):
+    """
+    Write graph to binary file, which can be loaded by load_csr.
+    The file is written to a temporary file first and then renamed, so that
+    a concurrent load never sees an incomplete file.
+
+    Arguments:
+        g (csr):
+            Graph in CSR format.
+        file_name (str):
+            File name for the graph to be written.
+        source (str):
+            Optional name of the source file the graph was read from, whose
+            modification time and size are stored in the header.
+
+    Returns:
+        err (int):
+            Indicator 0 for success and 1 for errors.
+    """
+
+    global MAGIC, HEADER
+    mtime, size = 0, 0
+    wtype = b'-' if g.weights is None else g.wtype.encode()
+    tmp_name = file_name + '.tmp' + str(os.getpid())
+    try:
+        if source is not None:
+            st = os.stat(source)
+            mtime, size = st.st_mtime_ns, st.st_size
+        with open(tmp_name, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, g.n, g.m, wtype, mtime, size))
+            f.write(g.keys)
+            f.write(g.offsets)
+            f.write(g.targets)
+            if g.weights is not None:
+                f.write(g.weights)
+        os.replace(tmp_name, file_name)
+        return 0
+    except:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        return 1
+
+def load_csr(file_name, source=None):
+    """
+    Load graph from binary file via mmap. The arrays of the graph are
+    read-only memoryviews of the mapped file, i.e. nothing is copied and
+    the pages are shared by all processes loading the same file.
+
+    Arguments:
+        file_name (str):
+            File name of the graph written by write_csr.
+        source (str):
+            Optional name of the source file, the graph is only loaded if
+            the modification time and size of the source file match the
+            header.
+
+    Returns:
+        g (csr):
+            Graph in CSR format, 'None' if the file is missing, invalid or
+            outdated.
+    """
+
+    global MAGIC, HEADER
+    try:
+        with open(file_name, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n, m, wtype, mtime, size = HEADER.unpack_from(mm)
+        if magic != MAGIC:
+            return None
+        if source is not None:
+            st = os.stat(source)
+            if (mtime, size) != (st.st_mtime_ns, st.st_size):
+                return None
+        # Cut arrays from the mapped file, all items have 8 bytes.
+        sections = [n, n + 1, m, 0 if wtype == b'-' else m]
+        if len(mm) != HEADER.size + 8*sum(sections):
+            return None
+        mv = memoryview(mm)
+        arrays = []
+        a = HEADER.size
+        for k, typecode in zip(sections, ['q', 'q', 'q', wtype.decode()]):
+            if typecode == '-':
+                arrays.append(None)
+            else:
+                arrays.append(mv[a:a + 8*k].cast(typecode))
+            a += 8*k
+        keys, offsets, targets, weights = arrays
+        return csr(offsets, targets, weights, keys)
+    except:
+        return None
+
+def read_cached(file_name, tag, read_csr):
+    """
+    Read graph from source file with a cache: the graph is loaded from the
+    binary file file_name.tag.csr if it is up to date with the source file,
+    otherwise it is read by read_csr and the binary file is (re)written.
+
+    Arguments:
+        file_name (str):
+            File name of the source file.
+        tag (str):
+            Name of the reader, distinguishing graphs read from the same
+            source file in different ways.
+        read_csr (function):
+            Reader function, returning status and graph for file_name.
+
+    Returns:
+        status (int):
+            '0' indicates successful processing, '1' that an error ocurred.
+        g (csr):
+            Graph in CSR format, 'None' in case of an error.
+    """
+
+    cache_name = file_name + '.' + tag + '.csr'
+    g = load_csr(cache_name, source=file_name)
+    if g is not None:
+        return 0, g
+    status, g = read_csr(file_name)
+    if not status:
+        write_csr(g, cache_name, source=file_name)
+    return status, g
@@ -0,0 +1,1101 @@
+# -*- coding: utf-8 -*-
+"""
+Dijkstra's algorithm for calculating shortest paths in a directed graph
+with only none-negative edge weights.
+
+A method collection for Stanford Algorithms Specialization 2 written
+by Oliver Kroneisen, oliver@kroneisen.net
+
+This module is related to the programming assignment #2 in the Course
+https://www.coursera.org/learn/algorithms-graphs-data-structures/home/module/2
+"""
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress, repeat
+import math
+from operator import and_, attrgetter, ge, ne
+import os
+import tempfile
+import threading
+from algorithms_galore import elements as el
+from algorithms_galore import heaps as ht
+from algorithms_galore import readers as rd
+from algorithms_galore.graphs import csr as cs
+
+global CMAX   # maximum edge weight for using a bucket queue
+CMAX = 65536
+global worker_cache   # graph and query state per file in a worker process
+worker_cache = {}
+
+def dijkstra_paths(nodes, adj_dict, s, arity=2):
+    """
+    Calculate shortest paths for directed graph with non-negative edge
+    weights from node start to all reachable nodes.
+
+    Arguments:
+        nodes (dict):
+            Dictionary of nodes, matching every node key to the node element
+            of class elem.
+            elem.key: key of node
+            elem.val: shortest path distance to start, initialized with
+                      math.inf
+            elem.idx: index of node within heap structure, -1 if not in heap
+            elem.ref: key of predecessor node on shortest path to start
+        adj_dict (dict):
+            Dictionary of nodes, matching every node to its adjacency list,
+            including the weights of edges.
+        s (elem):
+            Start node.
+        arity (int):
+            Optional number of children per node of the heap, where 2
+            (= default) selects the binary heap of class heap and any other
+            value the d-ary heap of class dheap.
+
+    Returns:
+        nodes (dict):
+            Changed dictionary of nodes with updated val and ref attributes.
+        X (list):
+            List of all reachable nodes from start as elements of class elem.
+    """
+
+    # Initialize data structures:
+    X = []   # nodes processed so far
+    s.val = 0   # distance from start to start node s is 0
+    s.ref = s.key   # predecessor of start node s is s itself
+    # Initialize heap.
+    nodes_list = []
+    for i in nodes.values():
+        nodes_list.append(i)
+    if arity == 2:
+        h = ht.heap(nodes_list, update_idx=True)
+    else:
+        h = ht.dheap(nodes_list, update_idx=True, arity=arity)
+    while True:
+        # Identify new node.
+        try:
+            w = h.deletem(update_idx=True)
+        except:
+            # No more reachable nodes.
+            return X
+        # Update shortest path information.
+        dw = w.val
+        adj_list = adj_dict[w.key]
+        for e in adj_list:   # edges of node w
+            u = nodes[e[0]]  # head of edge e
+            if u.idx > -1:   # only if u is still in heap
+                d2 = dw + e[1]   # distance of u to s via w
+                if d2 < u.val:
+                    u.ref = w.key
+                    # Position of u may now be incorrect, move u up in heap.
+                    h.decrease_key(u.idx, d2, update_idx=True)
+        # Add w to X.
+        X.append(w.key)
+    return X
+
+def max_weight(adj_dict):
+    """
+    Determine the maximum weight of all edges, if all weights are
+    non-negative integers.
+
+    Arguments:
+        adj_dict (dict):
+            Dictionary of nodes, matching every node to its adjacency list,
+            including the weights of edges.
+
+    Returns:
+        cmax (int):
+            Maximum weight of all edges, or 'None' in case of weights
+            which are no non-negative integers.
+    """
+
+    cmax = 0
+    for adj_list in adj_dict.values():
+        for e in adj_list:
+            w = e[1]
+            if type(w) is not int or w < 0:
+                return None
+            if w > cmax:
+                cmax = w
+    return cmax
+
+def dijkstra_paths_indexed(nodes, adj_dict, s, pq=None, targets=None,
+                           cmax=None):
+    """
+    Calculate shortest paths for directed graph with non-negative edge
+    weights from node start to all reachable nodes, using an indexed
+    priority queue.
+
+    In contrast to dijkstra_paths, the heap only contains the nodes on the
+    current frontier, addressed by integer ids instead of node elements,
+    and a changed distance is handled by a single decrease_key operation.
+    The attribute elem.idx is not used.
+
+    Arguments:
+        nodes (dict):
+            Dictionary of nodes, matching every node key to the node element
+            of class elem.
+            elem.key: key of node
+            elem.val: shortest path distance to start, initialized with
+                      math.inf
+            elem.ref: key of predecessor node on shortest path to start
+        adj_dict (dict):
+            Dictionary of nodes, matching every node to its adjacency list,
+            including the weights of edges.
+        s (elem):
+            Start node.
+        pq (class):
+            Optional priority queue class with the interface of class
+            iheap, e.g. iheap or pheap, which is initialized with the
+            number of nodes.
+            In case of 'None' (= default), a bucket queue of class bqueue
+            is used if all edge weights are integers <= CMAX, otherwise
+            an iheap.
+        targets (list):
+            Optional keys of target nodes. The search stops as soon as all
+            targets have been processed, so that only the distances of the
+            processed nodes in X are final.
+            In case of 'None' (= default), all reachable nodes are
+            processed.
+        cmax (int):
+            Optional maximum edge weight as returned by max_weight, to be
+            determined once for many queries on the same graph, only used
+            if pq is 'None'.
+            In case of 'None' (= default), it is determined by max_weight
+            on every call. If max_weight returns 'None', pass pq=ht.iheap
+            instead.
+
+    Returns:
+        nodes (dict):
+            Changed dictionary of nodes with updated val and ref attributes.
+        X (list):
+            List of all reachable nodes from start as elements of class elem.
+    """
+
+    # Targets still to be processed.
+    remaining = None if targets is None else set(targets)
+    # Map node keys to ids 0, ..., n - 1 for the indexed heap.
+    keys = list(nodes)
+    ids = {}
+    for i, key in enumerate(keys):
+        ids[key] = i
+    # Initialize data structures:
+    X = []   # nodes processed so far
+    s.val = 0   # distance from start to start node s is 0
+    s.ref = s.key   # predecessor of start node s is s itself
+    # Initialize priority queue with start node only.
+    if pq is None:
+        if cmax is None:
+            cmax = max_weight(adj_dict)
+        if cmax is not None and cmax <= CMAX:
+            h = ht.bqueue(len(keys), cmax)
+        else:
+            h = ht.iheap(len(keys))
+    else:
+        h = pq(len(keys))
+    h.insert(ids[s.key], 0)
+    while len(h):
+        # Identify new node.
+        i, _ = h.deletem()
+        w = nodes[keys[i]]
+        # Update shortest path information.
+        dw = w.val
+        adj_list = adj_dict[w.key]
+        for e in adj_list:   # edges of node w
+            u = nodes[e[0]]  # head of edge e
+            d2 = dw + e[1]   # distance of u to s via w
+            if d2 < u.val:   # never true for nodes already processed
+                u.val = d2
+                u.ref = w.key
+                j = ids[e[0]]
+                if j in h:
+                    h.decrease_key(j, d2)
+                else:
+                    h.insert(j, d2)
+        # Add w to X.
+        X.append(w.key)
+        if remaining is not None:
+            remaining.discard(w.key)
+            if not remaining:   # all targets processed
+                break
+    return X
+
+def dijkstra_paths_lazy(nodes, adj_dict, s):
+    """
+    Calculate shortest paths for directed graph with non-negative edge
+    weights from node start to all reachable nodes, using a heap with
+    lazy deletion.
+
+    The heap starts with the start node only and receives a new entry
+    (distance, key) whenever the distance of a node decreases.
+    Outdated entries stay in the heap and are skipped when they are
+    deleted, so that the size of the heap scales with the frontier of the
+    search and not with the number of nodes.
+    The attribute elem.idx is not used.
+
+    Arguments:
+        nodes (dict):
+            Dictionary of nodes, matching every node key to the node element
+            of class elem.
+            elem.key: key of node
+            elem.val: shortest path distance to start, initialized with
+                      math.inf
+            elem.ref: key of predecessor node on shortest path to start
+        adj_dict (dict):
+            Dictionary of nodes, matching every node to its adjacency list,
+            including the weights of edges.
+        s (elem):
+            Start node.
+
+    Returns:
+        nodes (dict):
+            Changed dictionary of nodes with updated val and ref attributes.
+        X (list):
+            List of all reachable nodes from start as elements of class elem.
+    """
+
+    # Initialize data structures:
+    X = []   # nodes processed so far
+    s.val = 0   # distance from start to start node s is 0
+    s.ref = s.key   # predecessor of start node s is s itself
+    # Initialize heap with start node only.
+    h = ht.heap([(0, s.key)])
+    while h.e:
+        # Identify new node.
+        dw, key = h.deletem()
+        w = nodes[key]
+        if dw > w.val:
+            # Outdated entry, node w has already been processed.
+            continue
+        # Update shortest path information.
+        adj_list = adj_dict[key]
+        for e in adj_list:   # edges of node w
+            u = nodes[e[0]]  # head of edge e
+            d2 = dw + e[1]   # distance of u to s via w
+            if d2 < u.val:   # never true for nodes already processed
+                u.val = d2
+                u.ref = key
+                h.insert((d2, e[0]))
+        # Add w to X.
+        X.append(key)
+    return X
+
+def tree_arrays(nodes):
+    """
+    Export the shortest path tree calculated by one of the dijkstra_paths
+    methods from the node elements into flat arrays indexed by node ids,
+    i.e. positions of the node keys in ascending order, as returned by
+    dijkstra_csr.
+
+    Arguments:
+        nodes (dict):
+            Dictionary of nodes, matching every node key to the node element
+            of class elem, with the attributes val and ref set by one of
+            the dijkstra_paths methods.
+
+    Returns:
+        keys (array):
+            Node keys in ascending order, i.e. keys[i] is the key of node i.
+        dist (array):
+            Shortest path distance to start per node id, math.inf for
+            nodes which are not reachable.
+        pred (array):
+            Id of predecessor node on shortest path to start per node id,
+            -1 for nodes which are not reachable, i for the start node i.
+    """
+
+    keys = array('q', sorted(nodes))
+    elements = list(map(nodes.__getitem__, keys))
+    dist = array('d', map(attrgetter('val'), elements))
+    ids = dict(zip(keys, range(len(keys))))
+    pred = array('q', map(ids.get, map(attrgetter('ref'), elements),
+                          repeat(-1)))
+    return keys, dist, pred
+
+def path(pred, t, keys=None):
+    """
+    Reconstruct the shortest path from start to node t by walking the
+    array of predecessors back to the start node.
+
+    Arguments:
+        pred (array):
+            Id of predecessor node per node id, -1 for nodes which are not
+            reachable and i for the start node i, as returned by
+            dijkstra_csr or tree_arrays.
+        t (int):
+            Id of target node.
+        keys (array):
+            Optional node keys per node id, the path is returned as keys
+            instead of ids.
+
+    Returns:
+        path (list):
+            Node ids (or keys) on the shortest path from start to t, empty
+            if t is not reachable.
+    """
+
+    if pred[t] < 0:
+        return []
+    p = [t]
+    while pred[t] != t:
+        t = pred[t]
+        p.append(t)
+    p.reverse()
+    if keys is not None:
+        p = list(map(keys.__getitem__, p))
+    return p
+
+def tree_edges(pred, keys=None):
+    """
+    Export the shortest path tree given by the array of predecessors as a
+    list of edges (pred[i], i) for all reachable nodes i except the start
+    node.
+
+    Arguments:
+        pred (array):
+            Id of predecessor node per node id, -1 for nodes which are not
+            reachable and i for the start node i, as returned by
+            dijkstra_csr or tree_arrays.
+        keys (array):
+            Optional node keys per node id, the edges are returned as keys
+            instead of ids.
+
+    Returns:
+        tails (array):
+            Tail nodes of the tree edges, i.e. the predecessors.
+        heads (array):
+            Head nodes of the tree edges, in ascending order.
+    """
+
+    n = len(pred)
+    # Tree nodes are reachable and not the start node.
+    mask = map(and_, map(ge, pred, repeat(0)), map(ne, pred, range(n)))
+    heads = array('q', compress(range(n), mask))
+    tails = array('q', map(pred.__getitem__, heads))
+    if keys is not None:
+        tails = array('q', map(keys.__getitem__, tails))
+        heads = array('q', map(keys.__getitem__, heads))
+    return tails, heads
+
+class state:
+    """
+    Class for the state of shortest path queries on a graph in CSR format,
+    i.e. the distance and predecessor arrays, which can be reused for many
+    queries on the same graph.
+    Only the entries touched by the last query are reset before the next
+    one, so that a query reaching few nodes does not pay for all nodes.
+
+    Arguments:
+        g (csr):
+            Graph in CSR format with arc weights.
+    """
+
+    def __init__(self, g):
+        """
+        Initialize query state.
+
+        Arguments:
+            g (csr):
+                Graph in CSR format with arc weights.
+        """
+
+        n = g.n
+        self.n = n
+        self.dist = array('d', [math.inf]) * n   # distance per node id
+        self.pred = array('q', [-1]) * n   # predecessor per node id
+        self.touched = array('q')   # node ids with changed entries
+        self.queues = {}   # priority queue per class, reused by queries
+        # Maximum arc weight if a bucket queue can be used, otherwise None.
+        # The weight range is determined once per graph.
+        self.cmax = None
+        if g.wtype == 'q':
+            wmin, wmax = g.weight_range()
+            if wmin >= 0 and wmax <= CMAX:
+                self.cmax = wmax
+        return
+
+    def reset(self):
+        """
+        Reset the entries touched by the last query.
+        """
+
+        dist, pred = self.dist, self.pred
+        for u in self.touched:
+            dist[u] = math.inf
+            pred[u] = -1
+        del self.touched[:]
+        return
+
+    def queue(self, pq=None):
+        """
+        Return an empty priority queue for a query. The queue is allocated
+        on the first call per queue class and only cleared on later calls.
+
+        Arguments:
+            pq (class):
+                Optional priority queue class with the interface of class
+                iheap, e.g. iheap or pheap, which is initialized with the
+                number of nodes.
+                In case of 'None' (= default), a bucket queue of class
+                bqueue if cmax is not 'None', otherwise an iheap.
+
+        Returns:
+            h (iheap):
+                Empty priority queue of class pq.
+        """
+
+        if pq is None:
+            pq = ht.iheap if self.cmax is None else ht.bqueue
+        h = self.queues.get(pq)
+        if h is None:
+            if pq is ht.bqueue:
+                h = pq(self.n, self.cmax)
+            else:
+                h = pq(self.n)
+            self.queues[pq] = h
+        else:
+            h.clear()
+        return h
+
+class state_pool:
+    """
+    Class for a thread-safe pool of query states for a graph in CSR format.
+    States are created on demand and returned to the pool after use, so
+    that concurrent queries (e.g. in threads) each work on their own state.
+
+    Arguments:
+        g (csr):
+            Graph in CSR format with arc weights.
+    """
+
+    def __init__(self, g):
+        """
+        Initialize empty pool.
+
+        Arguments:
+            g (csr):
+                Graph in CSR format with arc weights.
+        """
+
+        self.g = g
+        self.free = []   # states available for reuse
+        self.lock = threading.Lock()
+        return
+
+    def acquire(self):
+        """
+        Take a state from the pool, or create a new one if none is free.
+
+        Returns:
+            st (state):
+                Query state for the graph of the pool.
+        """
+
+        with self.lock:
+            if self.free:
+                return self.free.pop()
+        return state(self.g)
+
+    def release(self, st):
+        """
+        Return a state to the pool.
+
+        Arguments:
+            st (state):
+                Query state taken from the pool by acquire.
+        """
+
+        with self.lock:
+            self.free.append(st)
+        return
+
+def dijkstra_csr(g, s, pq=None, st=None, targets=None):
+    """
+    Calculate shortest paths for directed graph in CSR format with
+    non-negative arc weights from node start to all reachable nodes.
+
+    The graph is not changed, the results are returned in arrays indexed
+    by node ids, so that the same graph can be used by many queries, also
+    in concurrent threads with one state each.
+
+    Arguments:
+        g (csr):
+            Graph in CSR format with arc weights.
+        s (int):
+            Id of start node.
+        pq (class):
+            Optional priority queue class with the interface of class
+            iheap, e.g. iheap or pheap, which is initialized with the
+            number of nodes.
+            In case of 'None' (= default), a bucket queue of class bqueue
+            is used if all arc weights are integers <= CMAX, otherwise
+            an iheap.
+        st (state):
+            Optional query state to be reused, e.g. from a state_pool.
+            In case of 'None', a new state is allocated.
+        targets (list):
+            Optional ids of target nodes. The search stops as soon as all
+            targets have been processed, so that only their distances (and
+            those of all nodes closer to start) are final.
+            In case of 'None' (= default), all reachable nodes are
+            processed.
+
+    Returns:
+        dist (array):
+            Shortest path distance to start per node id, math.inf for
+            nodes which are not reachable.
+        pred (array):
+            Id of predecessor node on shortest path to start per node id,
+            -1 for nodes which are not reachable, s for node s.
+        The arrays belong to the state and are only valid until its next
+        query.
+    """
+
+    if st is None:
+        st = state(g)
+    else:
+        st.reset()
+    offsets, weights = g.offsets, g.weights
+    dist, pred, touched = st.dist, st.pred, st.touched
+    dist[s] = 0   # distance from start to start node s is 0
+    pred[s] = s   # predecessor of start node s is s itself
+    touched.append(s)
+    # Initialize priority queue with start node only.
+    h = st.queue(pq)
+    h.insert(s, 0)
+    # Targets still to be processed.
+    remaining = None if targets is None else set(targets)
+    heads = g.targets
+    while len(h):
+        # Identify new node.
+        w, _ = h.deletem()
+        if remaining is not None:
+            remaining.discard(w)
+            if not remaining:   # all targets processed
+                break
+        # Update shortest path information.
+        dw = dist[w]
+        for k in range(offsets[w], offsets[w + 1]):   # arcs of node w
+            u = heads[k]           # head of arc k
+            d2 = dw + weights[k]   # distance of u to s via w
+            if d2 < dist[u]:   # never true for nodes already processed
+                if u in h:
+                    h.decrease_key(u, d2)
+                else:
+                    h.insert(u, d2)
+                    touched.append(u)
+                dist[u] = d2
+                pred[u] = w
+    return dist, pred
+
+class bidir_state:
+    """
+    Class for the state of bidirectional shortest path queries on a graph
+    in CSR format, i.e. the reversed graph and one query state with its
+    priority queue per search direction, which can be reused for many
+    queries on the same graph.
+
+    Arguments:
+        g (csr):
+            Graph in CSR format with arc weights.
+        gr (csr):
+            Optional reversed graph of g. In case of 'None', it is created
+            once by g.transpose().
+    """
+
+    def __init__(self, g, gr=None):
+        """
+        Initialize query state.
+
+        Arguments:
+            g (csr):
+                Graph in CSR format with arc weights.
+            gr (csr):
+                Optional reversed graph of g. In case of 'None', it is
+                created once by g.transpose().
+        """
+
+        self.gr = g.transpose() if gr is None else gr
+        self.states = (state(g), state(self.gr))   # forward, backward
+        return
+
+    def reset(self):
+        """
+        Reset the entries touched by the last query in both directions.
+        """
+
+        for st in self.states:
+            st.reset()
+        return
+
+def dijkstra_bidir(g, s, t, gr=None, pq=ht.iheap, st=None):
+    """
+    Calculate the shortest path for directed graph in CSR format with
+    non-negative arc weights from node s to node t by bidirectional
+    Dijkstra, i.e. a forward search from s on the graph and a backward
+    search from t on the reversed graph, which meet in the middle.
+
+    The search with the smaller queue is advanced in every step. The best
+    path found so far has length mu = min(df(u) + db(u)) over all nodes u
+    reached by both searches; it is the shortest path as soon as the sum
+    of the distances of the last processed nodes of both searches is at
+    least mu.
+
+    Arguments:
+        g (csr):
+            Graph in CSR format with arc weights.
+        s (int):
+            Id of start node.
+        t (int):
+            Id of target node.
+        gr (csr):
+            Reversed graph, e.g. by g.transpose(), only used if st is
+            'None'. Either gr or st is required.
+        pq (class):
+            Optional priority queue class with the interface of class
+            iheap (= default), e.g. iheap or pheap.
+        st (bidir_state):
+            Optional query state to be reused for many queries, holding
+            the reversed graph. In case of 'None', a new state is
+            allocated for gr.
+
+    Returns:
+        d (float):
+            Shortest path distance from s to t, math.inf if t is not
+            reachable.
+        path (list):
+            Node ids on the shortest path from s to t, empty if t is not
+            reachable.
+    """
+
+    if st is None:
+        if gr is None:
+            msg = 'Error in dijkstra_bidir: Reversed graph gr or state ' \
+                  + 'st required.'
+            raise ValueError(msg)
+        st = bidir_state(g, gr)
+    else:
+        st.reset()
+    if s == t:
+        return 0.0, [s]
+    graphs = (g, st.gr)
+    dist = (st.states[0].dist, st.states[1].dist)
+    pred = (st.states[0].pred, st.states[1].pred)   # successors backward
+    touched = (st.states[0].touched, st.states[1].touched)
+    h = (st.states[0].queue(pq), st.states[1].queue(pq))
+    for d, u in ((0, s), (1, t)):
+        dist[d][u] = 0
+        pred[d][u] = u
+        touched[d].append(u)
+        h[d].insert(u, 0)
+    top = [0, 0]   # distance of last processed node per search
+    mu, meet = math.inf, -1   # length of best path and meeting node
+    while len(h[0]) and len(h[1]):
+        # Advance the search with the smaller queue.
+        d = 0 if len(h[0]) <= len(h[1]) else 1
+        w, dw = h[d].deletem()
+        top[d] = dw
+        if top[0] + top[1] >= mu:   # no shorter path possible
+            break
+        offsets, heads, weights = \
+            graphs[d].offsets, graphs[d].targets, graphs[d].weights
+        dist_d, dist_o, pred_d = dist[d], dist[1 - d], pred[d]
+        h_d, touched_d = h[d], touched[d]
+        for k in range(offsets[w], offsets[w + 1]):   # arcs of node w
+            u = heads[k]           # head of arc k
+            d2 = dw + weights[k]   # distance of u via w
+            if d2 < dist_d[u]:
+                if u in h_d:
+                    h_d.decrease_key(u, d2)
+                else:
+                    h_d.insert(u, d2)
+                    touched_d.append(u)
+                dist_d[u] = d2
+                pred_d[u] = w
+                # Check for a shorter path via u.
+                if d2 + dist_o[u] < mu:
+                    mu, meet = d2 + dist_o[u], u
+    if meet < 0:
+        return math.inf, []
+    # Join forward path s -> meet and backward path meet -> t.
+    path = [meet]
+    while path[-1] != s:
+        path.append(pred[0][path[-1]])
+    path.reverse()
+    while path[-1] != t:
+        path.append(pred[1][path[-1]])
+    return mu, path
+
+def astar_csr(g, s, t, h=None, pq=ht.iheap, st=None):
+    """
+    Calculate the shortest path for directed graph in CSR format with
+    non-negative arc weights from node s to node t by A* search, i.e.
+    Dijkstra's algorithm with the queue ordered by the distance to s plus
+    a lower bound of the distance to t, so that the search is directed
+    towards t and stops as soon as t is processed.
+
+    Arguments:
+        g (csr):
+            Graph in CSR format with arc weights.
+        s (int):
+            Id of start node.
+        t (int):
+            Id of target node.
+        h (function):
+            Optional heuristic h(u), returning a lower bound of the
+            distance from node id u to t (admissible), e.g. created by
+            alt.heuristic(t). With a consistent heuristic, every node is
+            processed at most once, otherwise nodes are reopened.
+            In case of 'None', h = 0, i.e. plain Dijkstra.
+        pq (class):
+            Optional priority queue class with the interface of class
+            iheap (= default), e.g. iheap or pheap.
+        st (state):
+            Optional query state to be reused, e.g. from a state_pool,
+            including its priority queue of class pq.
+            After the query, st.touched contains all nodes reached.
+
+    Returns:
+        d (float):
+            Shortest path distance from s to t, math.inf if t is not
+            reachable.
+        path (list):
+            Node ids on the shortest path from s to t, empty if t is not
+            reachable.
+    """
+
+    if st is None:
+        st = state(g)
+    else:
+        st.reset()
+    offsets, heads, weights = g.offsets, g.targets, g.weights
+    dist, pred, touched = st.dist, st.pred, st.touched
+    dist[s] = 0   # distance from start to start node s is 0
+    pred[s] = s   # predecessor of start node s is s itself
+    touched.append(s)
+    q = st.queue(pq)
+    q.insert(s, 0 if h is None else h(s))
+    while len(q):
+        # Identify new node with minimum distance plus lower bound.
+        w, _ = q.deletem()
+        if w == t:
+            break
+        # Update shortest path information.
+        dw = dist[w]
+        for k in range(offsets[w], offsets[w + 1]):   # arcs of node w
+            u = heads[k]           # head of arc k
+            d2 = dw + weights[k]   # distance of u to s via w
+            if d2 < dist[u]:
+                if dist[u] == math.inf:
+                    touched.append(u)
+                dist[u] = d2
+                pred[u] = w
+                f = d2 if h is None else d2 + h(u)
+                if u in q:
+                    q.decrease_key(u, f)
+                else:
+                    q.insert(u, f)   # new or reopened node
+    if dist[t] == math.inf:
+        return math.inf, []
+    path = [t]
+    while path[-1] != s:
+        path.append(pred[path[-1]])
+    path.reverse()
+    return dist[t], path
+
+class alt:
+    """
+    Class for the landmark tables of the ALT heuristic (A*, landmarks,
+    triangle inequality) for a graph in CSR format.
+
+    For every landmark L, the distances from L and to L are precomputed by
+    Dijkstra runs on the graph and the reversed graph. By the triangle
+    inequality, d(u, t) >= d(L, t) - d(L, u) and d(u, t) >= d(u, L) -
+    d(t, L), so that the maximum over all landmarks is an admissible and
+    consistent heuristic for A*.
+    The landmarks are selected greedily, each one farthest from the
+    landmarks selected before.
+
+    Arguments:
+        g (csr):
+            Graph in CSR format with arc weights.
+        k (int):
+            Optional number of landmarks.
+        gr (csr):
+            Optional reversed graph, in case of 'None' it is created by
+            g.transpose().
+        landmarks (list):
+            Optional ids of landmark nodes, replacing the selection.
+    """
+
+    def __init__(self, g, k=4, gr=None, landmarks=None):
+        """
+        Select landmarks and compute their distance tables.
+
+        Arguments:
+            g (csr):
+                Graph in CSR format with arc weights.
+            k (int):
+                Optional number of landmarks.
+            gr (csr):
+                Optional reversed graph, in case of 'None' it is created by
+                g.transpose().
+            landmarks (list):
+                Optional ids of landmark nodes, replacing the selection.
+        """
+
+        if gr is None:
+            gr = g.transpose()
+        self.landmarks = []
+        self.dfrom = []   # distances from landmark per node id
+        self.dto = []     # distances to landmark per node id
+        if landmarks is not None:
+            for L in landmarks:
+                self.add(g, gr, L)
+            return
+        near = array('d', [math.inf]) * g.n   # distance to nearest landmark
+        L = 0   # first landmark
+        while g.n and len(self.landmarks) < k:
+            dfrom, dto = self.add(g, gr, L)
+            for u in range(g.n):
+                d = min(dfrom[u], dto[u])
+                if d < near[u]:
+                    near[u] = d
+            # Select the node farthest from all landmarks, preferring
+            # nodes not connected to any landmark.
+            best, L = 0, -1
+            for u in range(g.n):
+                if near[u] > best:
+                    best, L = near[u], u
+            if L < 0:   # all nodes are landmarks
+                break
+        return
+
+    def add(self, g, gr, L):
+        """
+        Add landmark L and compute its distance tables.
+
+        Arguments:
+            g (csr):
+                Graph in CSR format with arc weights.
+            gr (csr):
+                Reversed graph.
+            L (int):
+                Id of landmark node.
+
+        Returns:
+            dfrom (array):
+                Distances from L per node id.
+            dto (array):
+                Distances to L per node id.
+        """
+
+        dfrom, _ = dijkstra_csr(g, L)
+        dto, _ = dijkstra_csr(gr, L)
+        self.landmarks.append(L)
+        self.dfrom.append(dfrom)
+        self.dto.append(dto)
+        return dfrom, dto
+
+    def heuristic(self, t):
+        """
+        Create the heuristic for target t to be used by astar_csr.
+
+        Arguments:
+            t (int):
+                Id of target node.
+
+        Returns:
+            h (function):
+                Function h(u) returning a lower bound of the distance from
+                node id u to t.
+        """
+
+        tables = [(dfrom, dfrom[t], dto, dto[t])
+                  for dfrom, dto in zip(self.dfrom, self.dto)]
+
+        def h(u):
+            b = 0
+            for dfrom, dft, dto, dtt in tables:
+                x = dft - dfrom[u]
+                if x > b:
+                    b = x
+                x = dto[u] - dtt
+                if x > b:
+                    b = x
+            return b
+
+        return h
+
+def query_worker(file_name, s):
+    """
+    Calculate shortest path distances from node s in a worker process of
+    dijkstra_many.
+    On the first query of the worker, the graph is loaded from the binary
+    file via mmap, i.e. all workers share the pages of the file, and the
+    query state is allocated; both are kept for all further queries.
+
+    Arguments:
+        file_name (str):
+            File name of the graph written by write_csr.
+        s (int):
+            Id of start node.
+
+    Returns:
+        dist (array):
+            Shortest path distance to start per node id, a copy of the
+            distances of the reused query state.
+    """
+
+    global worker_cache
+    if file_name not in worker_cache:
+        g = cs.load_csr(file_name)
+        worker_cache[file_name] = (g, state(g))
+    g, st = worker_cache[file_name]
+    dist, _ = dijkstra_csr(g, s, st=st)
+    return dist[:]
+
+def dijkstra_many(g, sources=None, workers=None):
+    """
+    Calculate shortest path distances for directed graph in CSR format from
+    many start nodes by independent runs of dijkstra_csr in a process pool.
+
+    The graph is not pickled: the workers load it via mmap from a binary
+    file, so that all processes share one copy of the arrays in memory.
+    A graph which has not been loaded from such a file is written to a
+    temporary file first.
+
+    Arguments:
+        g (csr or str):
+            Graph in CSR format with arc weights, or file name of a graph
+            written by write_csr, e.g. a cache file of read_csr.
+        sources (list):
+            Optional ids of start nodes, any iterable, all nodes in case of
+            'None'.
+        workers (int):
+            Optional number of worker processes, in case of 'None' the
+            number of CPUs. For 1, all queries run in the calling process.
+
+    Returns:
+        dists (list):
+            Distance matrix as list of arrays, with the shortest path
+            distances from sources[i] per node id in dists[i], math.inf
+            for nodes which are not reachable.
+    """
+
+    tmp_name = None
+    h = None
+    if isinstance(g, str):
+        file_name = g
+    else:
+        fd, tmp_name = tempfile.mkstemp(suffix='.csr')
+        os.close(fd)
+        if cs.write_csr(g, tmp_name):
+            os.remove(tmp_name)
+            msg = 'Error in dijkstra_many: Graph cannot be written.'
+            raise ValueError(msg)
+        file_name = tmp_name
+    try:
+        h = cs.load_csr(file_name)
+        if h is None:
+            msg = 'Error in dijkstra_many: No valid graph file.'
+            raise ValueError(msg)
+        sources = range(h.n) if sources is None else list(sources)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers == 1:
+            # Run the queries on the graph loaded here with one state.
+            st = state(h)
+            dists = [dijkstra_csr(h, s, st=st)[0][:] for s in sources]
+            del st
+        else:
+            h = None
+            # Hand out sources in chunks to reduce the communication.
+            chunksize = max(1, len(sources) // (4*workers))
+            with ProcessPoolExecutor(workers) as executor:
+                dists = list(executor.map(query_worker, repeat(file_name),
+                                          sources, chunksize=chunksize))
+    finally:
+        # Release the mapping of the file before removing it.
+        h = None
+        if tmp_name is not None:
+            os.remove(tmp_name)
+    return dists
+
+def read_list(file_name):
+    """
+    Read source data of directed edges (arcs).
+    Every row starts with the tail node of an arc, followed by 1 or several
+    tuples of [tail nodes, weights] for arcs.
+
+    Arguments:
+        file_name (str):
+            File name to be read.
+
+    Returns:
+        status (int):
+            '0' indicates successful processing, '1' that an error ocurred.
+        nodes (dict):
+            Dictionary of nodes, matching every node key to the node element
+            of class elem.
+            For each node element, attribute val is initialized with
+            math.inf,
+            idx with -1.
+        adj_dict (dict):
+            Dictionary of nodes, matching every node key to its adjacency list,
+            including the weights of edges.
+    """
+
+    # Initialize structures.
+    nodes = {}
+    adj_dict = {}
+    # Read list data from file in chunks.
+    # Each row represents 1 item of the list.
+    try:
+        for row in rd.read_rows(file_name, sep=','):
+            # Evaluate current row [tail, head, weight, head, weight, ...].
+            for node in row[0:1] + row[1::2]:
+                # Check if node is already in adj_dict.
+                if not node in adj_dict:
+                    # Create an empty entry for now.
+                    nodes[node] = el.elem(node, math.inf, -1)
+                    adj_dict[node] = []
+            # Insert arcs into adj_dict entry for tail.
+            adj_list = adj_dict[row[0]]
+            for j in range(1, len(row) - 1, 2):
+                adj_list.append([row[j], row[j + 1]])
+        return 0, nodes, adj_dict
+    except:
+        return 1, nodes, adj_dict
+
+def read_csr(file_name, cache=False):
+    """
+    Read source data of directed edges (arcs) in the format of read_list
+    into a graph in CSR format.
+
+    Arguments:
+        file_name (str):
+            File name to be read.
+        cache (bool):
+            Optional flag defining whether the graph shall be loaded from
+            or written to the binary cache file file_name.dijkstra.csr.
+
+    Returns:
+        status (int):
+            '0' indicates successful processing, '1' that an error ocurred.
+        g (csr):
+            Graph in CSR format, 'None' in case of an error.
+    """
+
+    if cache:
+        return cs.read_cached(file_name, 'dijkstra', read_csr)
+    try:
+        # Values per row alternate between head node and weight.
+        nodes, tails, values = rd.read_adjacency(file_name, sep=',')
+        tails, heads, weights = tails[0::2], values[0::2], values[1::2]
+        keys = set(nodes)
+        keys.update(heads)
+        g = cs.csr_from_edges(tails, heads, weights, keys=keys)
+        return 0, g
+    except:
+        return 1, None
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""
+Kruskal's greedy algorithm for calculating a minimal spanning tree in an
+undirected graph with weigthed edges (weights can also be negative).
+
+The edges are sorted once by weight and added to the tree unless they close
+a cycle, which is detected by a union-find structure in flat integer arrays
+with path compression and union by rank.
+
+Runtime: O(m log m) for a Graph with m edges and n vertices.
+
+A method collection for Stanford Algorithms Specialization 3 written
+by Oliver Kroneisen, oliver@kroneisen.net
+"""
+
+from array import array
+from operator import sub
+from itertools import repeat
+from algorithms_galore import readers as rd
+
+class unionfind:
+    """
+    Class for union-find structure (disjoint sets) of the ids 0, ..., n - 1.
+
+    Every set is a tree given by the array parent, whose root is the
+    representative of the set. The array rank holds an upper bound of the
+    height of the tree per root.
+
+    Arguments:
+        n (int):
+            Number of ids, every id is a set of its own initially.
+    """
+
+    def __init__(self, n):
+        """
+        Initialize union-find structure.
+
+        Arguments:
+            n (int):
+                Number of ids, every id is a set of its own initially.
+        """
+
+        self.n = n                          # number of ids
+        self.sets = n                       # number of sets
+        self.parent = array('q', range(n))  # parent id, root for itself
+        self.rank = array('b', [0]) * n     # rank of root
+        return
+
+    def __str__(self):
+        """
+        Convert union-find content to string.
+
+        Returns:
+            text (str):
+                Content of union-find converted to a string.
+        """
+
+        text = 'Union-find: ' + str(self.n) + ' ids, ' + str(self.sets) \
+               + ' sets'
+        return text
+
+    def __repr__(self):
+        """
+        Represent union-find as a string.
+
+        Returns:
+            text (str):
+                Representation of union-find.
+        """
+
+        return str(self)
+
+    def __len__(self):
+        """
+        Number of sets.
+
+        Returns:
+            sets (int):
+                Number of sets.
+        """
+
+        return self.sets
+
+    def find(self, i):
+        """
+        Find the representative of the set of id i and compress the path
+        from i to it.
+
+        Arguments:
+            i (int):
+                Id.
+
+        Returns:
+            root (int):
+                Representative of the set of i.
+        """
+
+        parent = self.parent
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        # Path compression, all ids on the path point to the root.
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    def union(self, i, j):
+        """
+        Merge the sets of ids i and j, by attaching the root of lower rank
+        to the root of higher rank.
+
+        Arguments:
+            i (int):
+                Id.
+            j (int):
+                Id.
+
+        Returns:
+            merged (bool):
+                'True' if the sets were merged, 'False' if i and j were
+                already in the same set.
+        """
+
+        ri, rj = self.find(i), self.find(j)
+        if ri == rj:
+            return False
+        rank = self.rank
+        if rank[ri] < rank[rj]:
+            ri, rj = rj, ri
+        self.parent[rj] = ri
+        if rank[ri] == rank[rj]:
+            rank[ri] += 1
+        self.sets -= 1
+        return True
+
+def kruskal_ids(n, tails, heads, weights):
+    """
+    Calculate minimum spanning tree (or forest, if the graph is not
+    connected) for undirected graph with edges given by node ids.
+
+    Arguments:
+        n (int):
+            Number of nodes.
+        tails (array):
+            Node ids of the first nodes of the edges.
+        heads (array):
+            Node ids of the second nodes of the edges.
+        weights (array):
+            Weights of the edges.
+
+    Returns:
+        cost (int or float):
+            Cost of minimum spanning tree.
+        edges (list):
+            Positions of the edges of minimum spanning tree in the arrays,
+            in the order of ascending weights.
+    """
+
+    cost = 0     # cost of minimum spanning tree
+    edges = []   # edges of minimum spanning tree
+    union = unionfind(n).union
+    # Sort edges once, ties in the order of the input.
+    order = sorted(range(len(weights)), key=weights.__getitem__)
+    for k in order:
+        if union(tails[k], heads[k]):
+            cost += weights[k]
+            edges.append(k)
+            if len(edges) == n - 1:   # tree is complete
+                break
+    return cost, edges
+
+def kruskal_MST(tails, heads, weights, keys=None):
+    """
+    Calculate minimum spanning tree (or forest, if the graph is not
+    connected) for undirected graph with edge weights (can also be
+    negative), given as a flat list of edges like in edges.txt.
+
+    Arguments:
+        tails (list):
+            Keys of the first nodes of the edges.
+        heads (list):
+            Keys of the second nodes of the edges.
+        weights (list):
+            Weights of the edges.
+        keys (list):
+            Optional keys of all nodes, e.g. including isolated nodes.
+            In case of 'None', the nodes are the nodes of the edges.
+
+    Returns:
+        cost (int or float):
+            Cost of minimum spanning tree.
+        T (list):
+            List of edges as node tuples (v, w) of minimum spanning tree,
+            in the order of ascending weights.
+    """
+
+    # Map node keys to ids 0, ..., n - 1.
+    if keys is None:
+        keys = set(tails)
+        keys.update(heads)
+    keys = sorted(keys)
+    n = len(keys)
+    if n and keys[-1] - keys[0] == n - 1:
+        # Consecutive keys, the id is the offset to the smallest key.
+        k0 = repeat(keys[0])
+        ids_tails = array('q', map(sub, tails, k0))
+        ids_heads = array('q', map(sub, heads, k0))
+        lo = min(min(ids_tails, default=0), min(ids_heads, default=0))
+        hi = max(max(ids_tails, default=0), max(ids_heads, default=0))
+        if lo < 0 or hi >= n:
+            msg = 'Error in kruskal_MST: Edge with unknown node.'
+            raise ValueError(msg)
+    else:
+        ids = dict(zip(keys, range(n)))
+        ids_tails = array('q', map(ids.__getitem__, tails))
+        ids_heads = array('q', map(ids.__getitem__, heads))
+        del ids
+    cost, edges = kruskal_ids(n, ids_tails, ids_heads, weights)
+    T = [(tails[k], heads[k]) for k in edges]
+    return cost, T
+
+def kruskal_csr(g):
+    """
+    Calculate minimum spanning tree (or forest, if the graph is not
+    connected) for undirected graph in CSR format with edge weights, i.e.
+    every edge is stored as two arcs.
+
+    Arguments:
+        g (csr):
+            Graph in CSR format with arc weights.
+
+    Returns:
+        cost (int or float):
+            Cost of minimum spanning tree.
+        T (list):
+            List of edges as node tuples (v, w) of minimum spanning tree,
+            in the order of ascending weights.
+    """
+
+    tails, heads, keys = g.tails(), g.targets, g.keys
+    cost, edges = kruskal_ids(g.n, tails, heads, g.weights)
+    T = [(keys[tails[k]], keys[heads[k]]) for k in edges]
+    return cost, T
+
+def read_list(file_name):
+    """
+    Read source data of undirected edges in the format of edges.txt, i.e.
+    a header line followed by rows of two nodes and a weight.
+
+    Arguments:
+        file_name (str):
+            File name to be read.
+
+    Returns:
+        status (int):
+            '0' indicates successful processing, '1' that an error ocurred.
+        tails (array):
+            First nodes of the edges.
+        heads (array):
+            Second nodes of the edges.
+        weights (array):
+            Weights of the edges.
+    """
+
+    try:
+        tails, heads, weights = rd.read_columns(file_name, 3, skip=1)
+        return 0, tails, heads, weights
+    except:
+        return 1, None, None, None
@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+"""
+Prim's greedy algorithm for calculating a minimal spanning tree in an
+undirected graph with weigthed edges (weights can also be negative).
+
+Runtime: O(m log n) for a Graph with m edges and n vertices.
+
+A method collection for Stanford Algorithms Specialization 3 written
+by Oliver Kroneisen, oliver@kroneisen.net
+
+This module is related to the programming assignment #1 in the Course
+https://www.coursera.org/learn/algorithms-greedy/home/module/1
+"""
+
+from array import array
+import math
+from algorithms_galore import elements as el
+from algorithms_galore import heaps as ht
+from algorithms_galore import readers as rd
+from algorithms_galore.graphs import csr as cs
+
+
+def prim_MST(nodes, adj_dict, s, arity=2):
+    """
+    Calculate minimum spanning tree for undirected graph with edge weights
+    (can also be negative) from node start to all reachable nodes.
+
+    Arguments:
+        nodes (dict):
+            Dictionary of nodes, matching every node key to the node element
+            of class elem.
+            elem.key: key of node
+            elem.val: distance to nodes set X, initialized with math.inf
+            elem.idx: index of node within heap structure, -1 if not in heap
+            elem.ref: key of closest node in X
+        adj_dict (dict):
+            Dictionary of nodes, matching every node to its adjacency list,
+            including the weights of edges.
+        s (elem):
+            Start node.
+        arity (int):
+            Optional number of children per node of the heap, where 2
+            (= default) selects the binary heap of class heap and any other
+            value the d-ary heap of class dheap.
+
+    Returns:
+        nodes (dict):
+            Changed dictionary of nodes with updated val attributes
+            (not relevant, all reachable notes will have val = 0).
+        cost (int or float):
+            Cost of minimum spanning tree.
+        T (list):
+            List of edges as node tuples (v, w) of minimum spanning tree.
+    """
+
+    # Initialize data structures:
+    T = []          # edges of minimum spanning tree
+    cost = 0        # cost of minimum spanning tree
+    X = []          # nodes processed so far
+    s.val = 0       # distance from start to start node s to X is 0
+    s.ref = s.key   # s is the closest node to s in X
+    X.append(s)
+    # Adjust distances to X for the neighbors of s.
+    adj_list = adj_dict[s.key]
+    for i in adj_list:
+        nodes[i[0]].val = i[1]
+        nodes[i[0]].ref = s.key
+    # Initialize heap, representing V - X.
+    nodes_list = []
+    for i in nodes.values():
+        if not i.key == s.key:
+            nodes_list.append(i)
+    if arity == 2:
+        h = ht.heap(nodes_list, update_idx=True)
+    else:
+        h = ht.dheap(nodes_list, update_idx=True, arity=arity)
+    while True:
+        # Identify new node.
+        try:
+            w = h.deletem(update_idx=True)
+            # Update cost of minimum spanning tree.
+            cost += w.val
+            # Add edge to minimum spanning tree T.
+            T.append((w.ref, w.key))
+        except:
+            # No more reachable nodes.
+            return cost, T
+        # Update distances of nodes in V - X to X.
+        w.val = 0   # node w becomes part of X
+        adj_list = adj_dict[w.key]
+        for e in adj_list:   # edges of node w
+            u = nodes[e[0]]  # other node incident to edge e
+            if u.idx > -1:   # only if u is still in heap, i.e. in V - X
+                d2 = e[1]    # distance of u to X via w
+                if d2 < u.val:
+                    u.ref = w.key
+                    # Position of u may now be incorrect, move u up in heap.
+                    h.decrease_key(u.idx, d2, update_idx=True)
+        # Add w to X.
+        X.append(w.key)
+    return cost, T
+
+def prim_MST_indexed(nodes, adj_dict, s, pq=ht.iheap):
+    """
+    Calculate minimum spanning tree for undirected graph with edge weights
+    (can also be negative) from node start to all reachable nodes, using an
+    indexed heap.
+
+    In contrast to prim_MST, the heap only contains the nodes adjacent to X,
+    addressed by integer ids instead of node elements, and the heap is only
+    changed if the distance of a node to X actually decreases.
+    The attribute elem.idx is not used.
+
+    Arguments:
+        nodes (dict):
+            Dictionary of nodes, matching every node key to the node element
+            of class elem.
+            elem.key: key of node
+            elem.val: distance to nodes set X, initialized with math.inf
+            elem.ref: key of closest node in X
+        adj_dict (dict):
+            Dictionary of nodes, matching every node to its adjacency list,
+            including the weights of edges.
+        s (elem):
+            Start node.
+        pq (class):
+            Optional priority queue class with the interface of class
+            iheap, e.g. iheap (= default) or pheap, which is initialized
+            with the number of nodes.
+
+    Returns:
+        nodes (dict):
+            Changed dictionary of nodes with updated val attributes
+            (not relevant, all reachable notes will have val = 0).
+        cost (int or float):
+            Cost of minimum spanning tree.
+        T (list):
+            List of edges as node tuples (v, w) of minimum spanning tree.
+    """
+
+    # Map node keys to ids 0, ..., n - 1 for the indexed heap.
+    keys = list(nodes)
+    ids = {}
+    for i, key in enumerate(keys):
+        ids[key] = i
+    # Initialize data structures:
+    T = []          # edges of minimum spanning tree
+    cost = 0        # cost of minimum spanning tree
+    X = bytearray(len(keys))   # flags for nodes processed so far
+    s.val = 0       # distance from start to start node s to X is 0
+    s.ref = s.key   # s is the closest node to s in X
+    # Initialize heap with start node only, representing the nodes
+    # adjacent to X.
+    h = pq(len(keys))
+    h.insert(ids[s.key], 0)
+    while len(h):
+        # Identify new node.
+        i, _ = h.deletem()
+        w = nodes[keys[i]]
+        if not w is s:
+            # Update cost of minimum spanning tree.
+            cost += w.val
+            # Add edge to minimum spanning tree T.
+            T.append((w.ref, w.key))
+        # Add w to X.
+        X[i] = 1
+        w.val = 0   # node w becomes part of X
+        # Update distances of nodes in V - X to X.
+        adj_list = adj_dict[w.key]
+        for e in adj_list:   # edges of node w
+            j = ids[e[0]]
+            if X[j]:     # u is already in X
+                continue
+            u = nodes[e[0]]  # other node incident to edge e
+            d2 = e[1]    # distance of u to X via w
+            if d2 < u.val:
+                u.val = d2
+                u.ref = w.key
+                if j in h:
+                    h.decrease_key(j, d2)
+                else:
+                    h.insert(j, d2)
+    return cost, T
+
+def prim_MST_lazy(nodes, adj_dict, s):
+    """
+    Calculate minimum spanning tree for undirected graph with edge weights
+    (can also be negative) from node start to all reachable nodes, using a
+    heap with lazy deletion.
+
+    Instead of changing the key of a node in the heap, every improved
+    distance of a node to X is inserted as a new entry (distance, node,
+    closest node in X). Outdated entries of nodes already in X are skipped
+    when they are removed from the heap, so neither elem.idx nor an
+    indexed heap is needed.
+
+    Arguments:
+        nodes (dict):
+            Dictionary of nodes, matching every node key to the node element
+            of class elem.
+            elem.key: key of node
+            elem.val: distance to nodes set X, initialized with math.inf
+            elem.ref: key of closest node in X
+        adj_dict (dict):
+            Dictionary of nodes, matching every node to its adjacency list,
+            including the weights of edges.
+        s (elem):
+            Start node.
+
+    Returns:
+        nodes (dict):
+            Changed dictionary of nodes with updated val attributes
+            (not relevant, all reachable notes will have val = 0).
+        cost (int or float):
+            Cost of minimum spanning tree.
+        T (list):
+            List of edges as node tuples (v, w) of minimum spanning tree.
+    """
+
+    # Initialize data structures:
+    T = []          # edges of minimum spanning tree
+    cost = 0        # cost of minimum spanning tree
+    X = set()       # nodes processed so far
+    s.val = 0       # distance from start to start node s to X is 0
+    s.ref = s.key   # s is the closest node to s in X
+    # Initialize heap with start node only.
+    h = ht.heap([(0, s.key, s.key)])
+    while h.e:
+        # Identify new node.
+        dw, key, ref = h.deletem()
+        if key in X:
+            # Outdated entry, node w has already been processed.
+            continue
+        w = nodes[key]
+        if not w is s:
+            # Update cost of minimum spanning tree.
+            cost += dw
+            # Add edge to minimum spanning tree T.
+            T.append((ref, key))
+        # Add w to X.
+        X.add(key)
+        w.val = 0   # node w becomes part of X
+        # Update distances of nodes in V - X to X.
+        adj_list = adj_dict[key]
+        for e in adj_list:   # edges of node w
+            if e[0] in X:    # u is already in X
+                continue
+            u = nodes[e[0]]  # other node incident to edge e
+            d2 = e[1]    # distance of u to X via w
+            if d2 < u.val:
+                u.val = d2
+                u.ref = key
+                h.insert((d2, e[0], key))
+    return cost, T
+
+def prim_csr(g, s, pq=ht.iheap):
+    """
+    Calculate minimum spanning tree for undirected graph in CSR format with
+    edge weights (can also be negative) from node start to all reachable
+    nodes.
+
+    Every undirected edge must be stored as two arcs in the graph.
+    The graph is not changed.
+
+    Arguments:
+        g (csr):
+            Graph in CSR format with arc weights.
+        s (int):
+            Id of start node.
+        pq (class):
+            Optional priority queue class with the interface of class
+            iheap, e.g. iheap (= default) or pheap, which is initialized
+            with the number of nodes.
+
+    Returns:
+        cost (int or float):
+            Cost of minimum spanning tree.
+        T (list):
+            List of edges as node key tuples (v, w) of minimum spanning tree.
+    """
+
+    n = g.n
+    offsets, targets, weights, keys = g.offsets, g.targets, g.weights, g.keys
+    # Initialize data structures:
+    T = []          # edges of minimum spanning tree
+    cost = 0        # cost of minimum spanning tree
+    X = bytearray(n)   # flags for nodes processed so far
+    pedge = array('q', [-1]) * n   # arc connecting node to X
+    pred = array('q', [-1]) * n    # closest node in X
+    # Initialize heap with start node only, representing the nodes
+    # adjacent to X.
+    h = pq(n)
+    h.insert(s, 0)
+    while len(h):
+        # Identify new node.
+        w, _ = h.deletem()
+        if w != s:
+            # Update cost of minimum spanning tree.
+            cost += weights[pedge[w]]
+            # Add edge to minimum spanning tree T.
+            T.append((keys[pred[w]], keys[w]))
+        # Add w to X.
+        X[w] = 1
+        # Update distances of nodes in V - X to X.
+        for k in range(offsets[w], offsets[w + 1]):   # edges of node w
+            u = targets[k]   # other node incident to edge k
+            if X[u]:         # u is already in X
+                continue
+            d2 = weights[k]  # distance of u to X via w
+            if u in h:
+                if d2 < h.key(u):
+                    pedge[u] = k
+                    pred[u] = w
+                    h.decrease_key(u, d2)
+            else:
+                pedge[u] = k
+                pred[u] = w
+                h.insert(u, d2)
+    return cost, T
+
+def read_list(file_name):
+    """
+    Read source data of undirected edges.
+    Every row starts with a node, followed by a node and a weight.
+
+    It is assumed that every undirected edge is only reported once,
+    but the adjacency lists of both incident nodes must be updated.
+
+    Arguments:
+        file_name (str):
+            File name to be read.
+
+    Returns:
+        status (int):
+            '0' indicates successful processing, '1' that an error ocurred.
+        nodes (dict):
+            Dictionary of nodes, matching every node key to the node element
+            of class elem.
+            For each node element, attribute val is initialized with
+            math.inf,
+            idx with -1.
+        adj_dict (dict):
+            Dictionary of nodes, matching every node key to its adjacency list,
+            including the weights of edges.
+    """
+
+    # Initialize structures.
+    nodes = {}
+    adj_dict = {}
+    # Read list data from file in chunks, skipping the header line.
+    # Each row represents 1 edge.
+    try:
+        anchs, heads, weights = rd.read_columns(file_name, 3, skip=1)
+        for anch, node, weight in zip(anchs, heads, weights):
+            # Check if anch is already in adj_dict.
+            if not anch in adj_dict:
+                # Create an empty entry for anch.
+                nodes[anch] = el.elem(anch, math.inf, -1)
+                adj_dict[anch] = []
+            # Check if node is already in adj_dict.
+            if not node in adj_dict:
+                # Create an empty entry for node.
+                nodes[node] = el.elem(node, math.inf, -1)
+                adj_dict[node] = []
+            # Insert edge into adj_dict for anch and for node.
+            adj_dict[anch].append([node, weight])
+            adj_dict[node].append([anch, weight])
+        return 0, nodes, adj_dict
+    except:
+        return 1, nodes, adj_dict
+
+def read_csr(file_name, cache=False):
+    """
+    Read source data of undirected edges in the format of read_list into
+    a graph in CSR format, storing every edge as two arcs.
+
+    Arguments:
+        file_name (str):
+            File name to be read.
+        cache (bool):
+            Optional flag defining whether the graph shall be loaded from
+            or written to the binary cache file file_name.prim.csr.
+
+    Returns:
+        status (int):
+            '0' indicates successful processing, '1' that an error ocurred.
+        g (csr):
+            Graph in CSR format, 'None' in case of an error.
+    """
+
+    if cache:
+        return cs.read_cached(file_name, 'prim', read_csr)
+    try:
+        anchs, heads, weights = rd.read_columns(file_name, 3, skip=1)
+        g = cs.csr_from_edges(anchs, heads, weights, undirected=True)
+        return 0, g
+    except:
+        return 1, None
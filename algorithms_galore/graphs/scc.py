@@ -0,0 +1,569 @@
+# -*- coding: utf-8 -*-
+"""
+Strongly Connected Components algorithms (Kosaraju's Two Pass algorithm
+and Tarjan's One Pass algorithm).
+
+A method collection for Stanford Algorithms Specialization 2 written
+by Oliver Kroneisen, oliver@kroneisen.net
+
+This module is related to the programming assignment #1 in the Course
+https://www.coursera.org/learn/algorithms-graphs-data-structures/home/module/1
+"""
+
+from array import array
+from collections import Counter
+from algorithms_galore import readers as rd
+from algorithms_galore.graphs import csr as cs
+
+global t   # global variable for finishing times (needed in pass 1)
+global s   # global variable for current source node (needed in pass 2)
+
+def DFSloop(nodes, nodes_stat, adj_dict):
+    """
+    Outer loop for recursive Depth-First Search (DFS) algorithm..
+
+    Arguments:
+        nodes (list):
+            List of all available nodes.
+        nodes_stat (dict):
+            Dictionary of nodes, providing a status list [ip, m, c] per node
+            with the following information:
+            ip: '0' not processed, '1' processed,
+            m: 'magical number' = finishing time,
+            l: leading node where DFS started so that node i was found.
+        adj_dict (dict):
+            Dictionary of nodes, matching every node to its adjacency list.
+
+    Returns:
+        nodes_stat (dict):
+            Changed dictionary of nodes.
+        nodes_new (list):
+            List of all nodes, sorted in descending order by finishing time.
+    """
+
+    # Initialize global variables.
+    global t
+    global s
+    t, s = 0, 0
+    # Initialize nodes_new.
+    nodes_new = []
+    # Ensure to process all nodes with outer loop.
+    for i in nodes:
+        if nodes_stat[i][0] < 1:   # node i not yet processed
+            # Update leading node number.
+            s = i
+            DFS(nodes, nodes_new, nodes_stat, adj_dict, s)
+    # Nodes have been appended in ascending order by finishing time.
+    nodes_new.reverse()
+    return nodes_new
+
+def DFS(nodes, nodes_new, nodes_stat, adj_dict, i):
+    """
+    Recursive Depth-First Search (DFS) algorithm..
+
+    Arguments:
+        nodes (list):
+            List of all available nodes.
+        nodes_new (list):
+            List of finished nodes, sorted in ascending order by finishing
+            time.
+        nodes_stat (dict):
+            Dictionary of nodes, providing a status list [ip, m, c] per node
+            with the following information:
+            ip: '0' not processed, '1' processed,
+            m: 'magical number' = finishing time,
+            l: leading node where DFS started so that node i was found.
+        adj_dict (dict):
+            Dictionary of nodes, matching every node to its adjacency list.
+        i (int):
+            Node number to start the DFS search from.
+
+    Returns:
+        nodes_new (list):
+            Changed list of finished nodes, sorted in ascending order
+            by finishing time.
+        nodes_stat (dict):
+            Changed dictionary of nodes.
+    """
+
+    global t
+    global s
+    # Mark node i as explored in current pass.
+    nodes_stat[i][0] += 1
+    # Set leading node.
+    nodes_stat[i][2] = s
+    # Process successors of i from adjacency list.
+    adj_list = adj_dict[i]
+    for j in adj_list:   # inner loop
+        if nodes_stat[j][0] < 1:   # node j not yet processed
+            DFS(nodes, nodes_new, nodes_stat, adj_dict, j)
+    # Increment and set finishing time for node i.
+    t += 1
+    nodes_stat[i][1] = t
+    # Append node i to nodes_new in ascending order by finishing time.
+    nodes_new.append(i)
+    return
+
+def DFSiter(nodes, nodes_stat, adj_dict):
+    """
+    Iterative Depth-First Search (DFS) algorithm..
+
+    Arguments:
+        nodes (list):
+            List of all available nodes.
+        nodes_stat (dict):
+            Dictionary of nodes, providing a status list [ip, m, c] per node
+            with the following information:
+            ip: '0' not processed, '1' processed,
+            m: 'magical number' = finishing time,
+            l: leading node where DFS started so that node i was found.
+        adj_dict (dict):
+            Dictionary of nodes, matching every node to its adjacency list.
+
+    Returns:
+        nodes_stat (dict):
+            Changed dictionary of nodes.
+        nodes_new (list):
+            List of all nodes, sorted in descending order by finishing time.
+    """
+
+    # Initialize global variables.
+    global t
+    global s
+    t, s = 0, 0
+    # Initialize nodes_new.
+    nodes_new = []
+    # Ensure to process all nodes with outer loop.
+    for i in nodes:
+        if nodes_stat[i][0] < 1:   # node i not yet processed
+            # Update leading node number.
+            s = i
+            # Mark node i as explored in current pass and set leading node.
+            nodes_stat[i][0] += 1
+            nodes_stat[i][2] = s
+            # Put node i on stack, together with an iterator over its
+            # adjacency list as cursor to the next successor to be checked.
+            stack = [(i, iter(adj_dict[i]))]
+            # Process stack in inner loop.
+            while stack:   # as long as the stack is not empty
+                j, cursor = stack[-1]   # keep node j on stack for now
+                # Advance cursor to the next unexplored successor of j.
+                for k in cursor:
+                    if nodes_stat[k][0] < 1:   # node k not explored
+                        # Mark node k as explored and set leading node.
+                        nodes_stat[k][0] += 1
+                        nodes_stat[k][2] = s
+                        # Put node k on top of stack.
+                        stack.append((k, iter(adj_dict[k])))
+                        break
+                else:
+                    # All successors of node j have been explored.
+                    # Increment and set finishing time for node j.
+                    t += 1
+                    nodes_stat[j][1] = t
+                    # Append node j to nodes_new in ascending order
+                    # by finishing time.
+                    nodes_new.append(j)
+                    # Remove node j from stack.
+                    stack.pop()
+    # Reverse nodes_new into descending order by finishing time.
+    nodes_new.reverse()
+    return nodes_new
+
+def extractSCC(nodes_stat):
+    """
+    Extract strongly connected components (SCCs) from nodes_stat.
+
+    Arguments:
+        nodes_stat (dict):
+            Dictionary of nodes, providing a status list [ip, m, c] per node
+            with the following information:
+            ip: '0' not processed, '1' processed,
+            m: 'magical number' = finishing time,
+            l: leading node where DFS started so that node i was found.
+
+    Returns:
+        components (dict):
+            Dictionary of leading nodes and the number of nodes in their
+            strongly connected component (SCC).
+        sizes (list):
+            List of unique sizes of SCCs in descending order.
+    """
+
+    # Count nodes per leading node.
+    components = Counter(stat[2] for stat in nodes_stat.values())
+    # Extract the unique sizes of components into a list.
+    # Remark: sorting the unique sizes is not linear in the number of SCCs.
+    # Using the DSelect algorithm, we could nonetheless determine
+    # the 10 largest SCCs still in linear time.
+    # However, we assume that the number of SCCs is much smaller than
+    # the number of nodes, so we can afford to sort the list.
+    sizes = sorted(set(components.values()), reverse=True)
+    return components, sizes
+
+def kosaraju_csr(g):
+    """
+    Calculate strongly connected components (SCCs) of directed graph in
+    CSR format by Kosaraju's Two Pass algorithm with iterative DFS.
+
+    Pass 1 runs on the transposed graph and records the finishing order,
+    pass 2 runs on the graph with the nodes in descending order by
+    finishing time.
+    The DFS keeps a cursor into the arcs of every node on the stack, so that
+    every arc is scanned only once and all stack operations take O(1).
+
+    Arguments:
+        g (csr):
+            Graph in CSR format.
+
+    Returns:
+        leader (array):
+            Id of the leading node where DFS started in pass 2 per node id,
+            i.e. nodes with the same leader form an SCC.
+    """
+
+    n = g.n
+    # Pass 1: DFS on transposed graph, collect nodes by finishing time.
+    gr = g.transpose()
+    offsets, targets = gr.offsets, gr.targets
+    explored = bytearray(n)
+    cursor = array('q', offsets[:n])   # next arc to scan per node
+    order = array('q')   # nodes in ascending order by finishing time
+    for i in range(n):
+        if explored[i]:
+            continue
+        explored[i] = 1
+        stack = [i]
+        while stack:
+            j = stack[-1]
+            k, end = cursor[j], offsets[j + 1]
+            # Skip arcs to explored nodes.
+            while k < end and explored[targets[k]]:
+                k += 1
+            if k < end:
+                # Descend to unexplored successor.
+                u = targets[k]
+                cursor[j] = k + 1
+                explored[u] = 1
+                stack.append(u)
+            else:
+                # All successors explored, node j is finished.
+                cursor[j] = k
+                stack.pop()
+                order.append(j)
+    del gr, cursor
+    # Pass 2: DFS on graph in descending order by finishing time.
+    offsets, targets = g.offsets, g.targets
+    leader = array('q', [-1]) * n
+    for i in reversed(order):
+        if leader[i] > -1:
+            continue
+        leader[i] = i
+        stack = [i]
+        while stack:
+            j = stack.pop()
+            for k in range(offsets[j], offsets[j + 1]):
+                u = targets[k]
+                if leader[u] < 0:   # node u not yet processed
+                    leader[u] = i
+                    stack.append(u)
+    return leader
+
+def tarjan_csr(g):
+    """
+    Calculate strongly connected components (SCCs) of directed graph in
+    CSR format by Tarjan's algorithm with iterative DFS.
+
+    Only one DFS pass on the graph itself is needed, i.e. no transposed
+    graph. Every node gets a preorder index and a low link, the smallest
+    index reachable via the DFS subtree and one arc to a node still on the
+    stack. A node with low link = index is the root of an SCC, which
+    consists of the nodes above it on the stack.
+    The components are found in reverse topological order of the
+    condensation, i.e. arcs between components always lead from a higher
+    to a lower component id.
+
+    Arguments:
+        g (csr):
+            Graph in CSR format.
+
+    Returns:
+        comp (array):
+            Component id 0, ..., k - 1 per node id.
+        sizes (array):
+            Number of nodes per component id.
+    """
+
+    n = g.n
+    offsets, targets = g.offsets, g.targets
+    index = array('q', [-1]) * n   # preorder index, -1 for unvisited
+    low = array('q', [0]) * n      # low link
+    comp = array('q', [-1]) * n    # component id, -1 while on stack
+    cursor = array('q', offsets[:n])   # next arc to scan per node
+    sizes = array('q')
+    stack = array('q')   # visited nodes without component
+    counter = 0
+    for i in range(n):
+        if index[i] > -1:
+            continue
+        index[i] = low[i] = counter
+        counter += 1
+        stack.append(i)
+        path = [i]   # DFS path from i
+        while path:
+            j = path[-1]
+            k, end = cursor[j], offsets[j + 1]
+            while k < end:
+                u = targets[k]
+                k += 1
+                if index[u] < 0:
+                    # Descend to unvisited successor.
+                    index[u] = low[u] = counter
+                    counter += 1
+                    stack.append(u)
+                    path.append(u)
+                    break
+                if comp[u] < 0 and index[u] < low[j]:   # u on stack
+                    low[j] = index[u]
+            else:
+                # All arcs of node j scanned, return to its parent.
+                path.pop()
+                if path and low[j] < low[path[-1]]:
+                    low[path[-1]] = low[j]
+                if low[j] == index[j]:
+                    # Node j is root of an SCC, pop its nodes from stack.
+                    c, size = len(sizes), 0
+                    u = -1
+                    while u != j:
+                        u = stack.pop()
+                        comp[u] = c
+                        size += 1
+                    sizes.append(size)
+            cursor[j] = k
+    return comp, sizes
+
+def components_csr(leader):
+    """
+    Convert the leading nodes of kosaraju_csr into dense component ids
+    0, ..., k - 1, numbered in order of first appearance, and count the
+    nodes per component.
+
+    Arguments:
+        leader (array):
+            Id of the leading node per node id.
+
+    Returns:
+        comp (array):
+            Component id per node id.
+        sizes (array):
+            Number of nodes per component id.
+    """
+
+    # Number leading nodes in order of first appearance.
+    ids = {}
+    for i in leader:
+        if i not in ids:
+            ids[i] = len(ids)
+    comp = array('q', map(ids.__getitem__, leader))
+    # Count nodes per component.
+    sizes = array('q', [0]) * len(ids)
+    for c, size in Counter(comp).items():
+        sizes[c] = size
+    return comp, sizes
+
+def condensation(g, comp, k=None):
+    """
+    Create the condensation of graph g, i.e. the directed acyclic graph
+    (DAG) with one node per SCC and an arc between two SCCs if there is at
+    least one arc between their nodes in g.
+
+    Arguments:
+        g (csr):
+            Graph in CSR format.
+        comp (array):
+            Component id 0, ..., k - 1 per node id, e.g. by tarjan_csr or
+            components_csr.
+        k (int):
+            Optional number of components, in case of 'None' max(comp) + 1.
+
+    Returns:
+        dag (csr):
+            Condensation in CSR format without weights, whose node keys and
+            ids are the component ids, without parallel arcs.
+    """
+
+    if k is None:
+        k = max(comp, default=-1) + 1
+    # Node ids grouped by component.
+    members, nodes, _ = cs._arrange(k, comp, array('q', range(g.n)), None)
+    offsets, targets = g.offsets, g.targets
+    last = array('q', [-1]) * k   # last tail component with an arc to c
+    tails, heads = array('q'), array('q')
+    for c in range(k):
+        for u in nodes[members[c]:members[c + 1]]:
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                # Drop arcs within a component and parallel arcs.
+                cv = comp[v]
+                if cv != c and last[cv] != c:
+                    last[cv] = c
+                    tails.append(c)
+                    heads.append(cv)
+    dag = cs.csr_from_edges(tails, heads, keys=range(k))
+    return dag
+
+def read_list(file_name, reverse=False):
+    """
+    Read source data of directed edges (arcs).
+    Every row starts with the tail node of an arc, followed by 1 or several
+    tail nodes for arcs.
+
+    Arguments:
+        file_name (str):
+            File name to be read.
+        reverse (bool):
+            Flag defining whether the meaning of tails and heads in the
+            input file shall be reversed.
+
+    Returns:
+        status (int):
+            '0' indicates successful processing, '1' that an error ocurred.
+        nodes (list):
+            List of all available nodes.
+        nodes_stat (dict):
+            Dictionary of nodes, providing a status list [ip, m, c] per node
+            with the following information:
+            ip: '0' not processed, '1' processed,
+            m: 'magical number' = finishing time,
+            l: leading node where DFS started so that node i was found.
+            Will be initialized in this method by [0, -1, -1].
+        adj_dict (dict):
+            Dictionary of nodes, matching every node to its adjacency list.
+    """
+
+    # Initialize structures.
+    nodes = []
+    nodes_stat = {}
+    adj_dict = {}
+    # Read list data from file in chunks.
+    # Each row represents 1 item of the list.
+    try:
+        for row in rd.read_rows(file_name):
+            # Evaluate current row [tail, head, head, ...].
+            for node in row:
+                # Check if node is already in adj_dict.
+                if not node in adj_dict:
+                    # Create an empty entry for now.
+                    nodes.append(node)
+                    nodes_stat[node] = [0, -1, -1]
+                    adj_dict[node] = []
+            node_1 = row[0]
+            if reverse:
+                # node_1 is tail, node_2 is head of arc.
+                # Insert node_1 into adj_dict entries for all node_2.
+                for node_2 in row[1:]:
+                    adj_dict[node_2].append(node_1)
+            else:
+                # node_1 is head, node_2 is tail of arc.
+                # Insert all node_2 into adj_dict entry for node_1.
+                adj_dict[node_1] += row[1:]
+        return 0, nodes, nodes_stat, adj_dict
+    except:
+        return 1, nodes, nodes_stat, adj_dict
+
+def read_graph(file_name):
+    """
+    Read source data of directed edges (arcs) in the format of read_list
+    once and build the adjacency lists of both the graph and the reversed
+    graph, i.e. the results of read_list with reverse=False and with
+    reverse=True.
+
+    Arguments:
+        file_name (str):
+            File name to be read.
+
+    Returns:
+        status (int):
+            '0' indicates successful processing, '1' that an error ocurred.
+        nodes (list):
+            List of all available nodes.
+        nodes_stat (dict):
+            Dictionary of nodes, providing a status list [ip, m, c] per node
+            as described for read_list, initialized by [0, -1, -1].
+        adj_dict (dict):
+            Dictionary of nodes, matching every node to its adjacency list.
+        adj_dict_rev (dict):
+            Dictionary of nodes, matching every node to its adjacency list
+            in the reversed graph.
+    """
+
+    # Initialize structures.
+    nodes = []
+    nodes_stat = {}
+    adj_dict = {}
+    adj_dict_rev = {}
+    # Read list data from file in chunks.
+    # Each row represents 1 item of the list.
+    try:
+        for row in rd.read_rows(file_name):
+            # Evaluate current row [tail, head, head, ...].
+            for node in row:
+                # Check if node is already in adj_dict.
+                if not node in adj_dict:
+                    # Create empty entries for now.
+                    nodes.append(node)
+                    nodes_stat[node] = [0, -1, -1]
+                    adj_dict[node] = []
+                    adj_dict_rev[node] = []
+            node_1 = row[0]
+            # Insert all heads node_2 into adj_dict entry for node_1 and
+            # node_1 into adj_dict_rev entries for all node_2.
+            adj_dict[node_1] += row[1:]
+            for node_2 in row[1:]:
+                adj_dict_rev[node_2].append(node_1)
+        return 0, nodes, nodes_stat, adj_dict, adj_dict_rev
+    except:
+        return 1, nodes, nodes_stat, adj_dict, adj_dict_rev
+
+def reset_stat(nodes_stat):
+    """
+    Reset the status lists of all nodes to [0, -1, -1], e.g. to run pass 2
+    on the same nodes_stat as pass 1.
+
+    Arguments:
+        nodes_stat (dict):
+            Dictionary of nodes, providing a status list [ip, m, c] per node.
+    """
+
+    for i in nodes_stat:
+        nodes_stat[i] = [0, -1, -1]
+    return
+
+def read_csr(file_name, cache=False):
+    """
+    Read source data of directed edges (arcs) in the format of read_list
+    into a graph in CSR format.
+
+    Arguments:
+        file_name (str):
+            File name to be read.
+        cache (bool):
+            Optional flag defining whether the graph shall be loaded from
+            or written to the binary cache file file_name.scc.csr.
+
+    Returns:
+        status (int):
+            '0' indicates successful processing, '1' that an error ocurred.
+        g (csr):
+            Graph in CSR format, 'None' in case of an error.
+    """
+
+    if cache:
+        return cs.read_cached(file_name, 'scc', read_csr)
+    try:
+        nodes, tails, heads = rd.read_adjacency(file_name)
+        keys = set(nodes)
+        keys.update(heads)
+        g = cs.csr_from_edges(tails, heads, keys=keys)
+        return 0, g
+    except:
+        return 1, None
@@ -0,0 +1,2013 @@
+# -*- coding: utf-8 -*-
+"""
+Heap classes to be used as an imported module.
+
+A method collection for Stanford Algorithms Specialization 2 written
+by Oliver Kroneisen, oliver@kroneisen.net
+"""
+
+from array import array
+
+class heap:
+    """
+    Class for minimum / maximum heap.
+    
+    The heap elements have to provide a lt / gt relation.
+    In case of flag update_idx = True, the elements also must have
+    an accessible idx attribute.
+    
+    Arguments:
+        elements (list):
+            List of elements to initialize the heap.
+        mintype (bool):
+            Optional flag defining whether the heap shall be a minimum heap
+            (= default) or a maximum heap.
+        update_idx (bool):
+            Optional flag defining whether the idx attribute shall be updated
+            during heap operations to always reflect the position of that
+            element in the heap.
+    """
+
+    def __init__(self, elements, mintype=True, update_idx=False):
+        """
+        Initialize heap.
+
+        Arguments:
+            elements (list):
+                List of elements to initialize the heap.
+            mintype (bool):
+                Optional flag defining whether the heap shall be a
+                minimum heap (= default) or a maximum heap.
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+        """
+
+        self.e = elements
+        self.mintype = mintype
+        self.heapify(update_idx=update_idx)
+        return
+
+    def __str__(self):
+        """
+        Convert heap content to string.
+
+        Returns:
+            text (str):
+                Content of heap converted to a string.
+        """
+
+        return 'Heap: ' + str(self.e)
+
+    def __repr__(self):
+        """
+        Represent heap as a string.
+
+        Returns:
+            text (str):
+                Representation of heap.
+        """
+
+        return str(self)
+
+    def heapify(self, update_idx=False):
+        """
+        Build-up minimum / maximum heap condition for the whole element list.
+
+        Arguments:
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+        """
+
+        n = len(self.e)
+        # Update idx attribute to match the position in the heap, if requested.
+        if update_idx:
+            for i in range(n):
+                self.e[i].idx = i
+        # Build-up heap.
+        if n > 1:   # nothing to do in case of less than 2 elements
+            i = n//2 - 1
+            while i >= 0:
+                self.reheap(i, n - 1, update_idx=update_idx)
+                i -= 1
+        return
+
+    def reheap(self, i, k, update_idx=False):
+        """
+        Re-establish minimum / maximum heap condition for element list
+        [i, ..., k] using the bottom-up logic.
+        The element at position i might violate the heap condition.
+
+        Arguments:
+            i (int):
+                Start index (inclusive) for applying reheap.
+            k (int):
+                Stop index (inclusive) for applying reheap.
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+        """
+
+        # Check parameters i, k.
+        if i > k:
+            # Swap parameters.
+            i, k = k, i
+        if i < 0 or k >= len(self.e):
+            msg = 'Error in reheap: Start/stop indices out of bound.'
+            raise ValueError(msg)
+
+        # Step 1.
+        j = i + 1   # the virtual heap index j starts with 1
+        if self.mintype:
+            while 2*j < k + 1:
+                if self.e[2*j - 1] < self.e[2*j]:
+                    j = 2*j   # comparison
+                else:
+                    j = 2*j + 1
+        else:
+            while 2*j < k + 1:
+                if self.e[2*j - 1] > self.e[2*j]:
+                    j = 2*j   # comparison
+                else:
+                    j = 2*j + 1
+        if 2*j == k + 1:
+            j = k + 1   # j is associated to leaf b
+
+        # Step 2. Sink in e[i] if necessary.
+        if self.mintype:
+            while self.e[i] < self.e[j - 1]:
+                j //= 2   # comparison
+        else:
+            while self.e[i] > self.e[j - 1]:
+                j //= 2   # comparison
+        # j is associated to q.
+
+        # Step 3.
+        # Swap e[i] and q (denoted by r now).
+        r, self.e[j - 1] = self.e[j - 1], self.e[i]
+        if update_idx:
+            self.e[j - 1].idx = j - 1
+        j //= 2
+        while j > i:   # move nodes (q and path to q) one step up
+        # Swap e[j - 1] and r.
+            r, self.e[j - 1] = self.e[j - 1], r
+            if update_idx:
+                self.e[j - 1].idx = j - 1
+            j //= 2
+        return
+
+    def upheap(self, idx, update_idx=False):
+        """
+        Raise element at idx in minimum / maximum heap, as long as it
+        violates the heap condition with respect to its parent.
+
+        Arguments:
+            idx (int):
+                Index of element to be raised.
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+
+        Returns:
+            idx (int):
+                New index of the element.
+        """
+
+        j = idx + 1   # the virtual heap index j starts with 1
+        if self.mintype:
+            while j > 1 and self.e[j - 1] < self.e[j//2 - 1]:
+                # Swap elements.
+                i = j//2
+                self.e[j - 1], self.e[i - 1] = self.e[i - 1], self.e[j - 1]
+                if update_idx:
+                    self.e[j - 1].idx, self.e[i - 1].idx = j - 1, i - 1
+                j = i
+        else:
+            while j > 1 and self.e[j - 1] > self.e[j//2 - 1]:
+                # Swap elements.
+                i = j//2
+                self.e[j - 1], self.e[i - 1] = self.e[i - 1], self.e[j - 1]
+                if update_idx:
+                    self.e[j - 1].idx, self.e[i - 1].idx = j - 1, i - 1
+                j = i
+        return j - 1
+
+    def insert(self, element, update_idx=False):
+        """
+        Insert element into minimum / maximum heap.
+
+        Arguments:
+            element (elem):
+                Element to be inserted.
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+        """
+
+        # Set idx of inserted element, if necessary.
+        n = len(self.e)
+        if update_idx:
+            element.idx = n
+        # Add element at end of heap.
+        self.e.append(element)
+        # Raise element in heap, if necessary.
+        self.upheap(n, update_idx=update_idx)
+        return
+
+    def deletem(self, update_idx=False):
+        """
+        Return and delete minimum / maximum element from minimum /
+        maximum heap.
+
+        Arguments:
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+
+        Returns:
+            element (elem):
+                Element deleted from heap.
+                In case the update flag is 'True', the idx attribute will be
+                reset to -1 to reflect that the element is not in the heap.
+        """
+
+        # Check heap.
+        n = len(self.e)
+        if n == 0:   # heap is empty
+            msg = 'Error in deletem: Heap is empty.'
+            raise ValueError(msg)
+        # Identify minimum / maximum at top of heap.
+        element = self.e[0]
+        # Swap element at top and last element.
+        self.e[0], self.e[n - 1] = self.e[n - 1], self.e[0]
+        if update_idx:
+            self.e[0].idx, self.e[n - 1].idx = 0, n - 1
+        # Drop last element.
+        self.e.pop()
+        # Reset idx of deleted element min, if necessary.
+        if update_idx:
+            element.idx = -1
+        # Re-establish heap condition.
+        if n > 2:   # nothing to do in case of less than 2 elements left
+            self.reheap(0, n - 2, update_idx=update_idx)
+        return element
+
+    def delete(self, idx, update_idx=False):
+        """
+        Return and delete element at idx from minimum / maximum heap.
+
+        Arguments:
+            idx (int):
+                Index of element to be returned and deleted.
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+
+        Returns:
+            element (elem):
+                Element deleted from heap.
+                In case the update flag is 'True', the idx attribute will be
+                reset to -1 to reflect that the element is not in the heap.
+        """
+
+        # Check parameter index.
+        n = len(self.e)
+        if idx < 0 or idx >= n:   # no such element in heap
+            msg = 'Error in delete: No such element in heap.'
+            raise ValueError(msg)
+        # Identify element at idx.
+        element = self.e[idx]
+        # Swap element at idx and last element.
+        self.e[idx], self.e[n - 1] = self.e[n - 1], self.e[idx]
+        if update_idx:
+            self.e[idx].idx, self.e[n - 1].idx = idx, n - 1
+        # Drop last element.
+        self.e.pop()
+        # Reset idx of deleted element, if necessary.
+        if update_idx:
+            element.idx = -1
+        # Raise element at idx in heap, if necessary.
+        if idx < n - 1:   # nothing to do in case of deletion of last element
+            j = self.upheap(idx, update_idx=update_idx) + 1
+            # Re-establish heap condition.
+            if n - j > 1:   # nothing to do in case of less than 2 elements
+                self.reheap(j - 1, n - 2, update_idx=update_idx)
+        return element
+
+    def decrease_key(self, idx, new_val, update_idx=False):
+        """
+        Decrease the value of the element at idx in minimum / maximum heap
+        and move it to its new position with a single sift.
+
+        For elements with a val attribute (e.g. of class elem), the attribute
+        is updated, otherwise the element itself is replaced by new_val.
+
+        Arguments:
+            idx (int):
+                Index of element to be changed.
+            new_val (int or float):
+                New value of the element, not greater than its current value.
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+        """
+
+        # Check parameters.
+        n = len(self.e)
+        if idx < 0 or idx >= n:   # no such element in heap
+            msg = 'Error in decrease_key: No such element in heap.'
+            raise ValueError(msg)
+        element = self.e[idx]
+        if hasattr(element, 'val'):
+            if new_val > element.val:
+                msg = 'Error in decrease_key: New value is too large.'
+                raise ValueError(msg)
+            element.val = new_val
+        else:
+            if new_val > element:
+                msg = 'Error in decrease_key: New value is too large.'
+                raise ValueError(msg)
+            self.e[idx] = new_val
+        # Move element up (minimum heap) or down (maximum heap).
+        if self.mintype:
+            self.upheap(idx, update_idx=update_idx)
+        else:
+            self.reheap(idx, n - 1, update_idx=update_idx)
+        return
+
+    def increase_key(self, idx, new_val, update_idx=False):
+        """
+        Increase the value of the element at idx in minimum / maximum heap
+        and move it to its new position with a single sift.
+
+        For elements with a val attribute (e.g. of class elem), the attribute
+        is updated, otherwise the element itself is replaced by new_val.
+
+        Arguments:
+            idx (int):
+                Index of element to be changed.
+            new_val (int or float):
+                New value of the element, not less than its current value.
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+        """
+
+        # Check parameters.
+        n = len(self.e)
+        if idx < 0 or idx >= n:   # no such element in heap
+            msg = 'Error in increase_key: No such element in heap.'
+            raise ValueError(msg)
+        element = self.e[idx]
+        if hasattr(element, 'val'):
+            if new_val < element.val:
+                msg = 'Error in increase_key: New value is too small.'
+                raise ValueError(msg)
+            element.val = new_val
+        else:
+            if new_val < element:
+                msg = 'Error in increase_key: New value is too small.'
+                raise ValueError(msg)
+            self.e[idx] = new_val
+        # Move element down (minimum heap) or up (maximum heap).
+        if self.mintype:
+            self.reheap(idx, n - 1, update_idx=update_idx)
+        else:
+            self.upheap(idx, update_idx=update_idx)
+        return
+
+    def insert_many(self, elements, update_idx=False):
+        """
+        Insert a batch of elements into minimum / maximum heap.
+
+        If the batch is at least as large as the heap, the elements are
+        appended and the heap is built-up again in linear time, otherwise
+        they are inserted one by one.
+
+        Arguments:
+            elements (list):
+                Elements to be inserted.
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+        """
+
+        n = len(self.e)
+        self.e.extend(elements)
+        if len(self.e) - n >= n:
+            # Merge batch and heap by building up the heap again.
+            self.heapify(update_idx=update_idx)
+        else:
+            # Raise the new elements one by one.
+            for j in range(n, len(self.e)):
+                if update_idx:
+                    self.e[j].idx = j
+                self.upheap(j, update_idx=update_idx)
+        return
+
+    def pushpop(self, element, update_idx=False):
+        """
+        Insert element into minimum / maximum heap, then return and delete
+        the minimum / maximum element, with a single sift at most.
+
+        Arguments:
+            element (elem):
+                Element to be inserted.
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+
+        Returns:
+            element (elem):
+                Element deleted from heap, which may be element itself.
+                In case the update flag is 'True', the idx attribute will be
+                reset to -1 to reflect that the element is not in the heap.
+        """
+
+        e = self.e
+        if e and (e[0] < element if self.mintype else e[0] > element):
+            # Top of heap has priority, replace it by element.
+            element, e[0] = e[0], element
+            if update_idx:
+                e[0].idx = 0
+            self.reheap(0, len(e) - 1, update_idx=update_idx)
+        if update_idx:
+            element.idx = -1
+        return element
+
+    def replace(self, element, update_idx=False):
+        """
+        Return and delete the minimum / maximum element, then insert
+        element into minimum / maximum heap, with a single sift.
+
+        Arguments:
+            element (elem):
+                Element to be inserted.
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+
+        Returns:
+            element (elem):
+                Element deleted from heap.
+                In case the update flag is 'True', the idx attribute will be
+                reset to -1 to reflect that the element is not in the heap.
+        """
+
+        # Check heap.
+        e = self.e
+        if not e:   # heap is empty
+            msg = 'Error in replace: Heap is empty.'
+            raise ValueError(msg)
+        # Replace top of heap by element.
+        element, e[0] = e[0], element
+        if update_idx:
+            e[0].idx = 0
+            element.idx = -1
+        self.reheap(0, len(e) - 1, update_idx=update_idx)
+        return element
+
+    def drain(self, k=None, update_idx=False):
+        """
+        Return and delete the minimum / maximum elements one after another,
+        until k elements have been returned or the heap is empty.
+
+        Arguments:
+            k (int):
+                Optional maximum number of elements to be returned,
+                with value 'None' in case the heap shall be drained completely.
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+
+        Yields:
+            element (elem):
+                Element deleted from heap.
+                In case the update flag is 'True', the idx attribute will be
+                reset to -1 to reflect that the element is not in the heap.
+        """
+
+        e = self.e
+        reheap = self.reheap
+        count = 0
+        while e and (k is None or count < k):
+            # Identify minimum / maximum at top of heap.
+            element = e[0]
+            # Move last element to top of heap.
+            last = e.pop()
+            n = len(e)
+            if n:
+                e[0] = last
+                if update_idx:
+                    last.idx = 0
+                if n > 1:   # nothing to do in case of less than 2 elements
+                    reheap(0, n - 1, update_idx)
+            if update_idx:
+                element.idx = -1
+            count += 1
+            yield element
+        return
+
+    def nsmallest(self, k, update_idx=False):
+        """
+        Return and delete the k smallest elements of a minimum heap, or the
+        k largest elements of a maximum heap, in ascending / descending
+        order.
+
+        Arguments:
+            k (int):
+                Maximum number of elements to be returned.
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+
+        Yields:
+            element (elem):
+                Element deleted from heap.
+        """
+
+        return self.drain(k=k, update_idx=update_idx)
+
+class dheap(heap):
+    """
+    Class for d-ary minimum / maximum heap.
+
+    Same as class heap, but every node of the heap has up to arity children,
+    i.e. the children of the element at index j are at the indices
+    arity*j + 1, ..., arity*j + arity.
+    A higher arity results in a shallower heap, which makes insert and
+    decrease_key cheaper, while deletem needs more comparisons per level.
+    Elements are sunk top-down, since the bottom-up logic of class heap
+    only pays off for binary heaps.
+
+    Arguments:
+        elements (list):
+            List of elements to initialize the heap.
+        mintype (bool):
+            Optional flag defining whether the heap shall be a minimum heap
+            (= default) or a maximum heap.
+        update_idx (bool):
+            Optional flag defining whether the idx attribute shall be updated
+            during heap operations to always reflect the position of that
+            element in the heap.
+        arity (int):
+            Optional number of children per node, at least 2 (default 4).
+    """
+
+    def __init__(self, elements, mintype=True, update_idx=False, arity=4):
+        """
+        Initialize heap.
+
+        Arguments:
+            elements (list):
+                List of elements to initialize the heap.
+            mintype (bool):
+                Optional flag defining whether the heap shall be a
+                minimum heap (= default) or a maximum heap.
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+            arity (int):
+                Optional number of children per node, at least 2 (default 4).
+        """
+
+        # Check parameter arity.
+        if arity < 2:
+            msg = 'Error in dheap: Arity must be at least 2.'
+            raise ValueError(msg)
+        self.arity = arity
+        self.e = elements
+        self.mintype = mintype
+        self.heapify(update_idx=update_idx)
+        return
+
+    def __str__(self):
+        """
+        Convert heap content to string.
+
+        Returns:
+            text (str):
+                Content of heap converted to a string.
+        """
+
+        return 'DHeap(' + str(self.arity) + '): ' + str(self.e)
+
+    def heapify(self, update_idx=False):
+        """
+        Build-up minimum / maximum heap condition for the whole element list.
+
+        Arguments:
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+        """
+
+        n = len(self.e)
+        # Update idx attribute to match the position in the heap, if requested.
+        if update_idx:
+            for i in range(n):
+                self.e[i].idx = i
+        # Build-up heap.
+        if n > 1:   # nothing to do in case of less than 2 elements
+            i = (n - 2)//self.arity   # last element with children
+            while i >= 0:
+                self.reheap(i, n - 1, update_idx=update_idx)
+                i -= 1
+        return
+
+    def reheap(self, i, k, update_idx=False):
+        """
+        Re-establish minimum / maximum heap condition for element list
+        [i, ..., k] by sinking the element at position i top-down.
+        The element at position i might violate the heap condition.
+
+        Arguments:
+            i (int):
+                Start index (inclusive) for applying reheap.
+            k (int):
+                Stop index (inclusive) for applying reheap.
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+        """
+
+        # Check parameters i, k.
+        if i > k:
+            # Swap parameters.
+            i, k = k, i
+        if i < 0 or k >= len(self.e):
+            msg = 'Error in reheap: Start/stop indices out of bound.'
+            raise ValueError(msg)
+
+        e = self.e
+        d = self.arity
+        x = e[i]   # element to be sunk, position i becomes a hole
+        j = i
+        c = d*j + 1   # first child of j
+        if self.mintype:
+            while c <= k:
+                # Identify minimum child m of j.
+                m = c
+                for c2 in range(c + 1, min(c + d, k + 1)):
+                    if e[c2] < e[m]:
+                        m = c2
+                if not e[m] < x:
+                    break
+                # Move child m up into the hole.
+                e[j] = e[m]
+                if update_idx:
+                    e[j].idx = j
+                j = m
+                c = d*j + 1
+        else:
+            while c <= k:
+                # Identify maximum child m of j.
+                m = c
+                for c2 in range(c + 1, min(c + d, k + 1)):
+                    if e[c2] > e[m]:
+                        m = c2
+                if not e[m] > x:
+                    break
+                # Move child m up into the hole.
+                e[j] = e[m]
+                if update_idx:
+                    e[j].idx = j
+                j = m
+                c = d*j + 1
+        e[j] = x
+        if update_idx:
+            x.idx = j
+        return
+
+    def upheap(self, idx, update_idx=False):
+        """
+        Raise element at idx in minimum / maximum heap, as long as it
+        violates the heap condition with respect to its parent.
+
+        Arguments:
+            idx (int):
+                Index of element to be raised.
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+
+        Returns:
+            idx (int):
+                New index of the element.
+        """
+
+        e = self.e
+        d = self.arity
+        x = e[idx]   # element to be raised, position idx becomes a hole
+        j = idx
+        if self.mintype:
+            while j > 0:
+                p = (j - 1)//d   # parent of j
+                if not x < e[p]:
+                    break
+                # Move parent p down into the hole.
+                e[j] = e[p]
+                if update_idx:
+                    e[j].idx = j
+                j = p
+        else:
+            while j > 0:
+                p = (j - 1)//d   # parent of j
+                if not x > e[p]:
+                    break
+                # Move parent p down into the hole.
+                e[j] = e[p]
+                if update_idx:
+                    e[j].idx = j
+                j = p
+        e[j] = x
+        if update_idx:
+            x.idx = j
+        return j
+
+class kheap:
+    """
+    Class for minimum / maximum heap ordered by precomputed sort keys.
+
+    A sort key is calculated once per element by the function key, when the
+    element is added to the heap, and stored in the list keys, parallel to
+    the list of elements e.
+    All comparisons are made between the sort keys, e.g. numbers or tuples,
+    so that no lt / gt methods of the elements are called.
+    In case of flag update_idx = True, the elements must have an
+    accessible idx attribute.
+
+    Arguments:
+        elements (list):
+            List of elements to initialize the heap.
+        key (function):
+            Function calculating the sort key of an element.
+        mintype (bool):
+            Optional flag defining whether the heap shall be a minimum heap
+            (= default) or a maximum heap.
+        update_idx (bool):
+            Optional flag defining whether the idx attribute shall be updated
+            during heap operations to always reflect the position of that
+            element in the heap.
+    """
+
+    def __init__(self, elements, key, mintype=True, update_idx=False):
+        """
+        Initialize heap.
+
+        Arguments:
+            elements (list):
+                List of elements to initialize the heap.
+            key (function):
+                Function calculating the sort key of an element.
+            mintype (bool):
+                Optional flag defining whether the heap shall be a
+                minimum heap (= default) or a maximum heap.
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+        """
+
+        self.e = elements
+        self.key = key
+        self.keys = [key(x) for x in elements]
+        self.mintype = mintype
+        self.heapify(update_idx=update_idx)
+        return
+
+    def __str__(self):
+        """
+        Convert heap content to string.
+
+        Returns:
+            text (str):
+                Content of heap converted to a string.
+        """
+
+        return 'KHeap: ' + str(self.e)
+
+    def __repr__(self):
+        """
+        Represent heap as a string.
+
+        Returns:
+            text (str):
+                Representation of heap.
+        """
+
+        return str(self)
+
+    def __len__(self):
+        """
+        Number of elements in the heap.
+
+        Returns:
+            size (int):
+                Number of elements in the heap.
+        """
+
+        return len(self.e)
+
+    def heapify(self, update_idx=False):
+        """
+        Build-up minimum / maximum heap condition for the whole element list.
+
+        Arguments:
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+        """
+
+        n = len(self.e)
+        # Update idx attribute to match the position in the heap, if requested.
+        if update_idx:
+            for i in range(n):
+                self.e[i].idx = i
+        # Build-up heap.
+        i = n//2 - 1
+        while i >= 0:
+            self.reheap(i, update_idx=update_idx)
+            i -= 1
+        return
+
+    def reheap(self, i, update_idx=False):
+        """
+        Move the element at position i down until none of its children
+        violates the minimum / maximum heap condition.
+
+        Arguments:
+            i (int):
+                Position of the element to be moved down.
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+        """
+
+        e, keys = self.e, self.keys
+        n = len(e)
+        x, kx = e[i], keys[i]   # element to be sunk, position i becomes a hole
+        c = 2*i + 1   # left child of i
+        if self.mintype:
+            while c < n:
+                # Select the smaller child.
+                if c + 1 < n and keys[c + 1] < keys[c]:
+                    c += 1
+                if not keys[c] < kx:
+                    break
+                # Move child up into the hole.
+                e[i], keys[i] = e[c], keys[c]
+                if update_idx:
+                    e[i].idx = i
+                i = c
+                c = 2*i + 1
+        else:
+            while c < n:
+                # Select the greater child.
+                if c + 1 < n and keys[c + 1] > keys[c]:
+                    c += 1
+                if not keys[c] > kx:
+                    break
+                # Move child up into the hole.
+                e[i], keys[i] = e[c], keys[c]
+                if update_idx:
+                    e[i].idx = i
+                i = c
+                c = 2*i + 1
+        e[i], keys[i] = x, kx
+        if update_idx:
+            x.idx = i
+        return
+
+    def upheap(self, i, update_idx=False):
+        """
+        Move the element at position i up until its parent does not violate
+        the minimum / maximum heap condition.
+
+        Arguments:
+            i (int):
+                Position of the element to be moved up.
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+
+        Returns:
+            i (int):
+                New position of the element.
+        """
+
+        e, keys = self.e, self.keys
+        x, kx = e[i], keys[i]   # element to be raised, position i is a hole
+        if self.mintype:
+            while i > 0:
+                p = (i - 1) >> 1   # parent of i
+                if not kx < keys[p]:
+                    break
+                # Move parent down into the hole.
+                e[i], keys[i] = e[p], keys[p]
+                if update_idx:
+                    e[i].idx = i
+                i = p
+        else:
+            while i > 0:
+                p = (i - 1) >> 1   # parent of i
+                if not kx > keys[p]:
+                    break
+                # Move parent down into the hole.
+                e[i], keys[i] = e[p], keys[p]
+                if update_idx:
+                    e[i].idx = i
+                i = p
+        e[i], keys[i] = x, kx
+        if update_idx:
+            x.idx = i
+        return i
+
+    def insert(self, element, update_idx=False):
+        """
+        Insert element into minimum / maximum heap.
+
+        Arguments:
+            element (elem):
+                Element to be inserted.
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+        """
+
+        # Add element and its sort key at end of heap and raise it.
+        self.e.append(element)
+        self.keys.append(self.key(element))
+        self.upheap(len(self.e) - 1, update_idx=update_idx)
+        return
+
+    def deletem(self, update_idx=False):
+        """
+        Return and delete minimum / maximum element from minimum /
+        maximum heap.
+
+        Arguments:
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+
+        Returns:
+            element (elem):
+                Element deleted from heap.
+                In case the update flag is 'True', the idx attribute will be
+                reset to -1 to reflect that the element is not in the heap.
+        """
+
+        # Check heap.
+        if not self.e:   # heap is empty
+            msg = 'Error in deletem: Heap is empty.'
+            raise ValueError(msg)
+        return self.delete(0, update_idx=update_idx)
+
+    def delete(self, idx, update_idx=False):
+        """
+        Return and delete element at idx from minimum / maximum heap.
+
+        Arguments:
+            idx (int):
+                Index of element to be returned and deleted.
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+
+        Returns:
+            element (elem):
+                Element deleted from heap.
+                In case the update flag is 'True', the idx attribute will be
+                reset to -1 to reflect that the element is not in the heap.
+        """
+
+        # Check parameter index.
+        e, keys = self.e, self.keys
+        n = len(e)
+        if idx < 0 or idx >= n:   # no such element in heap
+            msg = 'Error in delete: No such element in heap.'
+            raise ValueError(msg)
+        element = e[idx]
+        # Drop last element and move it into the gap at idx.
+        last, klast = e.pop(), keys.pop()
+        if idx < n - 1:   # nothing to do in case of deletion of last element
+            e[idx], keys[idx] = last, klast
+            if self.upheap(idx, update_idx=update_idx) == idx:
+                self.reheap(idx, update_idx=update_idx)
+        # Reset idx of deleted element, if necessary.
+        if update_idx:
+            element.idx = -1
+        return element
+
+    def drain(self, k=None, update_idx=False):
+        """
+        Return and delete the minimum / maximum elements one after another,
+        until k elements have been returned or the heap is empty.
+
+        Arguments:
+            k (int):
+                Optional maximum number of elements to be returned,
+                with value 'None' in case the heap shall be drained completely.
+            update_idx (bool):
+                Optional flag defining whether the idx attribute shall be
+                updated during heap operations to always reflect the position
+                of that element in the heap.
+
+        Yields:
+            element (elem):
+                Element deleted from heap.
+                In case the update flag is 'True', the idx attribute will be
+                reset to -1 to reflect that the element is not in the heap.
+        """
+
+        e, keys = self.e, self.keys
+        reheap = self.reheap
+        count = 0
+        while e and (k is None or count < k):
+            # Identify minimum / maximum at top of heap.
+            element = e[0]
+            # Move last element to top of heap.
+            last, klast = e.pop(), keys.pop()
+            if e:
+                e[0], keys[0] = last, klast
+                reheap(0, update_idx)
+            if update_idx:
+                element.idx = -1
+            count += 1
+            yield element
+        return
+
+class iheap:
+    """
+    Class for indexed minimum / maximum heap (priority queue).
+
+    In contrast to class heap, the items are not element objects, but
+    integer ids 0, ..., n - 1 (e.g. node numbers of a graph), each with
+    a numeric key.
+    The heap order, the position of every id in the heap and the keys are
+    stored in parallel arrays, so that no objects need to be created and
+    no idx attributes need to be updated during heap operations.
+    The position array allows a real O(log n) decrease_key operation.
+
+    Arguments:
+        n (int):
+            Capacity of the heap, i.e. the ids 0, ..., n - 1 can be stored.
+        mintype (bool):
+            Optional flag defining whether the heap shall be a minimum heap
+            (= default) or a maximum heap.
+    """
+
+    def __init__(self, n, mintype=True):
+        """
+        Initialize an empty indexed heap.
+
+        Arguments:
+            n (int):
+                Capacity of the heap, i.e. the ids 0, ..., n - 1 can be
+                stored.
+            mintype (bool):
+                Optional flag defining whether the heap shall be a
+                minimum heap (= default) or a maximum heap.
+        """
+
+        self.mintype = mintype
+        self.size = 0                         # number of ids in heap
+        self.h = array('l', [0]) * n          # ids in heap order
+        self.pos = array('l', [-1]) * n       # position of id or -1
+        self.keys = array('d', [0.0]) * n     # key of id
+        return
+
+    def __str__(self):
+        """
+        Convert heap content to string.
+
+        Returns:
+            text (str):
+                Content of heap converted to a string.
+        """
+
+        items = [str(i) + ':' + str(self.keys[i]) for i in self.h[:self.size]]
+        return 'IHeap: [' + ', '.join(items) + ']'
+
+    def __repr__(self):
+        """
+        Represent heap as a string.
+
+        Returns:
+            text (str):
+                Representation of heap.
+        """
+
+        return str(self)
+
+    def __len__(self):
+        """
+        Number of ids in the heap.
+
+        Returns:
+            size (int):
+                Number of ids in the heap.
+        """
+
+        return self.size
+
+    def __contains__(self, i):
+        """
+        Check whether id i is in the heap.
+
+        Returns:
+            condition (bool):
+                True, if id i is in the heap.
+        """
+
+        return self.pos[i] > -1
+
+    def clear(self):
+        """
+        Remove all ids from the heap, in time proportional to the number
+        of ids in it, so that it can be reused without a new allocation.
+        """
+
+        pos = self.pos
+        for i in self.h[:self.size]:
+            pos[i] = -1
+        self.size = 0
+        return
+
+    def key(self, i):
+        """
+        Return the current key of id i.
+
+        Arguments:
+            i (int):
+                Id to look up.
+
+        Returns:
+            key (float):
+                Key of id i (only meaningful if i is in the heap).
+        """
+
+        return self.keys[i]
+
+    def upheap(self, k):
+        """
+        Move the id at position k up until its parent does not violate
+        the minimum / maximum heap condition.
+
+        Arguments:
+            k (int):
+                Position of the id to be moved up.
+        """
+
+        h, pos, keys = self.h, self.pos, self.keys
+        i = h[k]
+        x = keys[i]
+        if self.mintype:
+            while k > 0:
+                p = (k - 1) >> 1   # parent position
+                j = h[p]
+                if x < keys[j]:
+                    # Move parent down into the hole.
+                    h[k] = j
+                    pos[j] = k
+                    k = p
+                else:
+                    break
+        else:
+            while k > 0:
+                p = (k - 1) >> 1   # parent position
+                j = h[p]
+                if x > keys[j]:
+                    # Move parent down into the hole.
+                    h[k] = j
+                    pos[j] = k
+                    k = p
+                else:
+                    break
+        h[k] = i
+        pos[i] = k
+        return
+
+    def reheap(self, k):
+        """
+        Move the id at position k down until none of its children violates
+        the minimum / maximum heap condition.
+
+        Arguments:
+            k (int):
+                Position of the id to be moved down.
+        """
+
+        h, pos, keys = self.h, self.pos, self.keys
+        n = self.size
+        i = h[k]
+        x = keys[i]
+        c = 2*k + 1   # left child position
+        if self.mintype:
+            while c < n:
+                # Select the smaller child.
+                if c + 1 < n and keys[h[c + 1]] < keys[h[c]]:
+                    c += 1
+                j = h[c]
+                if keys[j] < x:
+                    # Move child up into the hole.
+                    h[k] = j
+                    pos[j] = k
+                    k = c
+                    c = 2*k + 1
+                else:
+                    break
+        else:
+            while c < n:
+                # Select the greater child.
+                if c + 1 < n and keys[h[c + 1]] > keys[h[c]]:
+                    c += 1
+                j = h[c]
+                if keys[j] > x:
+                    # Move child up into the hole.
+                    h[k] = j
+                    pos[j] = k
+                    k = c
+                    c = 2*k + 1
+                else:
+                    break
+        h[k] = i
+        pos[i] = k
+        return
+
+    def insert(self, i, key):
+        """
+        Insert id i with key into minimum / maximum heap.
+
+        Arguments:
+            i (int):
+                Id to be inserted.
+            key (int or float):
+                Key of id i.
+        """
+
+        # Check parameter i.
+        if self.pos[i] > -1:
+            msg = 'Error in insert: Id is already in heap.'
+            raise ValueError(msg)
+        # Add id at end of heap and move it up.
+        k = self.size
+        self.size += 1
+        self.h[k] = i
+        self.pos[i] = k
+        self.keys[i] = key
+        self.upheap(k)
+        return
+
+    def deletem(self):
+        """
+        Return and delete id with minimum / maximum key from minimum /
+        maximum heap.
+
+        Returns:
+            i (int):
+                Id deleted from heap.
+            key (float):
+                Key of id i.
+        """
+
+        # Check heap.
+        n = self.size
+        if n == 0:   # heap is empty
+            msg = 'Error in deletem: Heap is empty.'
+            raise ValueError(msg)
+        h = self.h
+        i = h[0]
+        self.pos[i] = -1
+        n -= 1
+        self.size = n
+        if n > 0:
+            # Move last id to the top and re-establish heap condition.
+            h[0] = h[n]
+            self.reheap(0)
+        return i, self.keys[i]
+
+    def delete(self, i):
+        """
+        Return key and delete id i from minimum / maximum heap.
+
+        Arguments:
+            i (int):
+                Id to be deleted.
+
+        Returns:
+            key (float):
+                Key of id i.
+        """
+
+        # Check parameter i.
+        k = self.pos[i]
+        if k < 0:   # no such id in heap
+            msg = 'Error in delete: No such id in heap.'
+            raise ValueError(msg)
+        h = self.h
+        self.pos[i] = -1
+        n = self.size - 1
+        self.size = n
+        if k < n:   # nothing to do in case of deletion of last id
+            # Move last id into the gap and re-establish heap condition.
+            j = h[n]
+            h[k] = j
+            self.upheap(k)
+            if self.pos[j] == k:   # id j has not moved up
+                self.reheap(k)
+        return self.keys[i]
+
+    def decrease_key(self, i, key):
+        """
+        Decrease the key of id i in minimum / maximum heap.
+
+        Arguments:
+            i (int):
+                Id whose key shall be decreased.
+            key (int or float):
+                New key, not greater than the current key of id i.
+        """
+
+        # Check parameters.
+        k = self.pos[i]
+        if k < 0:   # no such id in heap
+            msg = 'Error in decrease_key: No such id in heap.'
+            raise ValueError(msg)
+        if key > self.keys[i]:
+            msg = 'Error in decrease_key: Key is greater than current key.'
+            raise ValueError(msg)
+        self.keys[i] = key
+        if self.mintype:
+            self.upheap(k)
+        else:
+            self.reheap(k)
+        return
+
+    def increase_key(self, i, key):
+        """
+        Increase the key of id i in minimum / maximum heap.
+
+        Arguments:
+            i (int):
+                Id whose key shall be increased.
+            key (int or float):
+                New key, not less than the current key of id i.
+        """
+
+        # Check parameters.
+        k = self.pos[i]
+        if k < 0:   # no such id in heap
+            msg = 'Error in increase_key: No such id in heap.'
+            raise ValueError(msg)
+        if key < self.keys[i]:
+            msg = 'Error in increase_key: Key is less than current key.'
+            raise ValueError(msg)
+        self.keys[i] = key
+        if self.mintype:
+            self.reheap(k)
+        else:
+            self.upheap(k)
+        return
+
+class pnode:
+    """
+    Class for nodes of a pairing heap.
+
+    Every node refers to its first child, its right sibling and to prev,
+    which is its left sibling or, for a first child, its parent.
+
+    Arguments:
+        i (int):
+            Id of the node.
+        key (int or float):
+            Key of the node.
+    """
+
+    __slots__ = ('i', 'key', 'child', 'sibling', 'prev')
+
+    def __init__(self, i, key):
+        """
+        Initialize pairing heap node.
+
+        Arguments:
+            i (int):
+                Id of the node.
+            key (int or float):
+                Key of the node.
+        """
+
+        self.i = i
+        self.key = key
+        self.child = None
+        self.sibling = None
+        self.prev = None
+        return
+
+class pheap:
+    """
+    Class for pairing heap (priority queue) with ids.
+
+    The pairing heap offers the same interface as class iheap, but stores
+    the ids in a tree of pnode objects, which gives amortized O(1) insert,
+    decrease_key and meld and amortized O(log n) deletem.
+    A maximum heap stores the negated keys internally.
+
+    Arguments:
+        n (int):
+            Number of possible ids 0, ..., n - 1 (only for compatibility with
+            class iheap, the pairing heap has no fixed capacity).
+        mintype (bool):
+            Optional flag defining whether the heap shall be a minimum heap
+            (= default) or a maximum heap.
+    """
+
+    def __init__(self, n=0, mintype=True):
+        """
+        Initialize an empty pairing heap.
+
+        Arguments:
+            n (int):
+                Number of possible ids 0, ..., n - 1 (only for compatibility
+                with class iheap, the pairing heap has no fixed capacity).
+            mintype (bool):
+                Optional flag defining whether the heap shall be a
+                minimum heap (= default) or a maximum heap.
+        """
+
+        self.mintype = mintype
+        self.root = None
+        self.nodes = {}   # pnode of every id in the heap
+        return
+
+    def __str__(self):
+        """
+        Convert heap content to string.
+
+        Returns:
+            text (str):
+                Content of heap converted to a string.
+        """
+
+        items = [str(i) + ':' + str(self.key(i)) for i in self.nodes]
+        return 'PHeap: [' + ', '.join(items) + ']'
+
+    def __repr__(self):
+        """
+        Represent heap as a string.
+
+        Returns:
+            text (str):
+                Representation of heap.
+        """
+
+        return str(self)
+
+    def __len__(self):
+        """
+        Number of ids in the heap.
+
+        Returns:
+            size (int):
+                Number of ids in the heap.
+        """
+
+        return len(self.nodes)
+
+    def __contains__(self, i):
+        """
+        Check whether id i is in the heap.
+
+        Returns:
+            condition (bool):
+                True, if id i is in the heap.
+        """
+
+        return i in self.nodes
+
+    def clear(self):
+        """
+        Remove all ids from the heap, so that it can be reused.
+        """
+
+        self.root = None
+        self.nodes = {}
+        return
+
+    def key(self, i):
+        """
+        Return the current key of id i.
+
+        Arguments:
+            i (int):
+                Id to look up.
+
+        Returns:
+            key (int or float):
+                Key of id i.
+        """
+
+        key = self.nodes[i].key
+        return key if self.mintype else -key
+
+    def link(self, a, b):
+        """
+        Link two pairing heap trees, the root with the greater key becomes
+        the first child of the other root.
+
+        Arguments:
+            a (pnode):
+                Root of the first tree.
+            b (pnode):
+                Root of the second tree.
+
+        Returns:
+            root (pnode):
+                Root of the linked tree.
+        """
+
+        if b.key < a.key:
+            a, b = b, a
+        # Make b the first child of a.
+        c = a.child
+        b.prev = a
+        b.sibling = c
+        if c is not None:
+            c.prev = b
+        a.child = b
+        return a
+
+    def cut(self, node):
+        """
+        Cut the subtree of node out of its tree (node must not be the root).
+
+        Arguments:
+            node (pnode):
+                Root of the subtree to be cut.
+        """
+
+        prev, sibling = node.prev, node.sibling
+        if prev.child is node:   # node is first child of prev
+            prev.child = sibling
+        else:
+            prev.sibling = sibling
+        if sibling is not None:
+            sibling.prev = prev
+        node.prev = node.sibling = None
+        return
+
+    def pair(self, first):
+        """
+        Combine a list of sibling trees into one tree by two-pass pairing.
+
+        Arguments:
+            first (pnode):
+                First tree of the sibling list, or 'None'.
+
+        Returns:
+            root (pnode):
+                Root of the combined tree, or 'None'.
+        """
+
+        # Pass 1: link pairs of trees from left to right.
+        trees = []
+        a = first
+        while a is not None:
+            b = a.sibling
+            if b is None:
+                a.prev = None
+                trees.append(a)
+                break
+            nxt = b.sibling
+            a.prev = a.sibling = b.prev = b.sibling = None
+            trees.append(self.link(a, b))
+            a = nxt
+        if not trees:
+            return None
+        # Pass 2: link the trees from right to left.
+        root = trees.pop()
+        while trees:
+            root = self.link(trees.pop(), root)
+        return root
+
+    def insert(self, i, key):
+        """
+        Insert id i with key into minimum / maximum heap.
+
+        Arguments:
+            i (int):
+                Id to be inserted.
+            key (int or float):
+                Key of id i.
+        """
+
+        # Check parameter i.
+        if i in self.nodes:
+            msg = 'Error in insert: Id is already in heap.'
+            raise ValueError(msg)
+        node = pnode(i, key if self.mintype else -key)
+        self.nodes[i] = node
+        if self.root is None:
+            self.root = node
+        else:
+            self.root = self.link(self.root, node)
+        return
+
+    def deletem(self):
+        """
+        Return and delete id with minimum / maximum key from minimum /
+        maximum heap.
+
+        Returns:
+            i (int):
+                Id deleted from heap.
+            key (int or float):
+                Key of id i.
+        """
+
+        # Check heap.
+        root = self.root
+        if root is None:   # heap is empty
+            msg = 'Error in deletem: Heap is empty.'
+            raise ValueError(msg)
+        del self.nodes[root.i]
+        self.root = self.pair(root.child)
+        return root.i, root.key if self.mintype else -root.key
+
+    def delete(self, i):
+        """
+        Return key and delete id i from minimum / maximum heap.
+
+        Arguments:
+            i (int):
+                Id to be deleted.
+
+        Returns:
+            key (int or float):
+                Key of id i.
+        """
+
+        # Check parameter i.
+        if not i in self.nodes:   # no such id in heap
+            msg = 'Error in delete: No such id in heap.'
+            raise ValueError(msg)
+        node = self.nodes.pop(i)
+        if node is self.root:
+            self.root = self.pair(node.child)
+        else:
+            # Cut node and link its combined children to the root.
+            self.cut(node)
+            sub = self.pair(node.child)
+            if sub is not None:
+                self.root = self.link(self.root, sub)
+        return node.key if self.mintype else -node.key
+
+    def decrease_key(self, i, key):
+        """
+        Decrease the key of id i in minimum / maximum heap.
+
+        Arguments:
+            i (int):
+                Id whose key shall be decreased.
+            key (int or float):
+                New key, not greater than the current key of id i.
+        """
+
+        # Check parameters.
+        node = self.nodes.get(i)
+        if node is None:   # no such id in heap
+            msg = 'Error in decrease_key: No such id in heap.'
+            raise ValueError(msg)
+        if key > self.key(i):
+            msg = 'Error in decrease_key: Key is greater than current key.'
+            raise ValueError(msg)
+        if not self.mintype:
+            # The internal key of a maximum heap increases.
+            self.delete(i)
+            self.insert(i, key)
+            return
+        node.key = key
+        if node is not self.root:
+            # Cut node and link it to the root.
+            self.cut(node)
+            self.root = self.link(self.root, node)
+        return
+
+    def increase_key(self, i, key):
+        """
+        Increase the key of id i in minimum / maximum heap.
+
+        Arguments:
+            i (int):
+                Id whose key shall be increased.
+            key (int or float):
+                New key, not less than the current key of id i.
+        """
+
+        # Check parameters.
+        node = self.nodes.get(i)
+        if node is None:   # no such id in heap
+            msg = 'Error in increase_key: No such id in heap.'
+            raise ValueError(msg)
+        if key < self.key(i):
+            msg = 'Error in increase_key: Key is less than current key.'
+            raise ValueError(msg)
+        if self.mintype:
+            # The internal key of a minimum heap increases.
+            self.delete(i)
+            self.insert(i, key)
+            return
+        node.key = -key
+        if node is not self.root:
+            # Cut node and link it to the root.
+            self.cut(node)
+            self.root = self.link(self.root, node)
+        return
+
+    def meld(self, other):
+        """
+        Meld another pairing heap of the same type into this heap.
+        The other heap is empty afterwards.
+
+        Linking the roots takes O(1), the ids of the smaller heap are
+        moved into the id table of the greater heap.
+
+        Arguments:
+            other (pheap):
+                Pairing heap with ids disjoint to the ids of this heap.
+        """
+
+        # Check parameter other.
+        if other.mintype != self.mintype:
+            msg = 'Error in meld: Heaps must be of the same type.'
+            raise ValueError(msg)
+        if other.root is not None:
+            if self.root is None:
+                self.root = other.root
+            else:
+                self.root = self.link(self.root, other.root)
+            if len(self.nodes) < len(other.nodes):
+                self.nodes, other.nodes = other.nodes, self.nodes
+            self.nodes.update(other.nodes)
+        other.root = None
+        other.nodes = {}
+        return
+
+class bqueue:
+    """
+    Class for bucket queue (Dial's algorithm) with ids and integer keys.
+
+    The bucket queue offers the same interface as class iheap for
+    minimum keys, but is restricted to monotone use with non-negative
+    integer keys:
+    every key inserted must lie in the range [m, m + cmax], where m is the
+    key last deleted by deletem, as it is the case for the distances of
+    Dijkstra's algorithm with integer edge weights <= cmax.
+    Keys may also be given as floats with integer values.
+    The ids are kept in a circular array of cmax + 1 buckets, so that insert,
+    delete and decrease_key take O(1) and deletem scans the buckets in
+    ascending key order, i.e. in total not more than the largest key.
+
+    Arguments:
+        n (int):
+            Number of possible ids 0, ..., n - 1 (only for compatibility with
+            class iheap, the bucket queue has no fixed capacity).
+        cmax (int):
+            Maximum difference between a key inserted and the key last
+            deleted, e.g. the maximum edge weight.
+    """
+
+    def __init__(self, n, cmax):
+        """
+        Initialize an empty bucket queue.
+
+        Arguments:
+            n (int):
+                Number of possible ids 0, ..., n - 1 (only for compatibility
+                with class iheap, the bucket queue has no fixed capacity).
+            cmax (int):
+                Maximum difference between a key inserted and the key last
+                deleted, e.g. the maximum edge weight.
+        """
+
+        self.cmax = cmax
+        self.nb = cmax + 1                 # number of buckets
+        self.buckets = [None] * self.nb    # set of ids per bucket
+        self.keys = {}                     # key of every id in the queue
+        self.cur = 0                       # key of current bucket
+        return
+
+    def __str__(self):
+        """
+        Convert bucket queue content to string.
+
+        Returns:
+            text (str):
+                Content of bucket queue converted to a string.
+        """
+
+        items = [str(i) + ':' + str(k) for i, k in self.keys.items()]
+        return 'BQueue: [' + ', '.join(items) + ']'
+
+    def __repr__(self):
+        """
+        Represent bucket queue as a string.
+
+        Returns:
+            text (str):
+                Representation of bucket queue.
+        """
+
+        return str(self)
+
+    def __len__(self):
+        """
+        Number of ids in the bucket queue.
+
+        Returns:
+            size (int):
+                Number of ids in the bucket queue.
+        """
+
+        return len(self.keys)
+
+    def __contains__(self, i):
+        """
+        Check whether id i is in the bucket queue.
+
+        Returns:
+            condition (bool):
+                True, if id i is in the bucket queue.
+        """
+
+        return i in self.keys
+
+    def clear(self):
+        """
+        Remove all ids from the queue, in time proportional to the number
+        of ids in it, so that it can be reused without a new allocation.
+        """
+
+        for key in self.keys.values():
+            self.buckets[int(key) % self.nb] = None
+        self.keys = {}
+        self.cur = 0
+        return
+
+    def key(self, i):
+        """
+        Return the current key of id i.
+
+        Arguments:
+            i (int):
+                Id to look up.
+
+        Returns:
+            key (int):
+                Key of id i.
+        """
+
+        return self.keys[i]
+
+    def insert(self, i, key):
+        """
+        Insert id i with key into bucket queue.
+
+        Arguments:
+            i (int):
+                Id to be inserted.
+            key (int):
+                Key of id i, in the range [m, m + cmax].
+        """
+
+        # Check parameters.
+        if i in self.keys:
+            msg = 'Error in insert: Id is already in bucket queue.'
+            raise ValueError(msg)
+        if key < self.cur or key > self.cur + self.cmax:
+            msg = 'Error in insert: Key out of range of bucket queue.'
+            raise ValueError(msg)
+        self.keys[i] = key
+        b = int(key) % self.nb
+        bucket = self.buckets[b]
+        if bucket is None:
+            self.buckets[b] = {i}
+        else:
+            bucket.add(i)
+        return
+
+    def deletem(self):
+        """
+        Return and delete id with minimum key from bucket queue.
+
+        Returns:
+            i (int):
+                Id deleted from bucket queue.
+            key (int):
+                Key of id i.
+        """
+
+        # Check bucket queue.
+        if not self.keys:   # bucket queue is empty
+            msg = 'Error in deletem: Bucket queue is empty.'
+            raise ValueError(msg)
+        # Scan buckets in ascending key order for the next non-empty bucket.
+        buckets, nb = self.buckets, self.nb
+        cur = self.cur
+        bucket = buckets[cur % nb]
+        while not bucket:
+            cur += 1
+            bucket = buckets[cur % nb]
+        self.cur = cur
+        i = bucket.pop()
+        del self.keys[i]
+        return i, cur
+
+    def delete(self, i):
+        """
+        Return key and delete id i from bucket queue.
+
+        Arguments:
+            i (int):
+                Id to be deleted.
+
+        Returns:
+            key (int):
+                Key of id i.
+        """
+
+        # Check parameter i.
+        if not i in self.keys:   # no such id in bucket queue
+            msg = 'Error in delete: No such id in bucket queue.'
+            raise ValueError(msg)
+        key = self.keys.pop(i)
+        self.buckets[int(key) % self.nb].discard(i)
+        return key
+
+    def decrease_key(self, i, key):
+        """
+        Decrease the key of id i in bucket queue.
+
+        Arguments:
+            i (int):
+                Id whose key shall be decreased.
+            key (int):
+                New key, not greater than the current key of id i
+                and not less than the key last deleted.
+        """
+
+        # Check parameters.
+        old = self.keys.get(i)
+        if old is None:   # no such id in bucket queue
+            msg = 'Error in decrease_key: No such id in bucket queue.'
+            raise ValueError(msg)
+        if key > old:
+            msg = 'Error in decrease_key: Key is greater than current key.'
+            raise ValueError(msg)
+        if key < self.cur:
+            msg = 'Error in decrease_key: Key out of range of bucket queue.'
+            raise ValueError(msg)
+        # Move id i to the bucket of the new key.
+        self.buckets[int(old) % self.nb].discard(i)
+        self.keys[i] = key
+        b = int(key) % self.nb
+        bucket = self.buckets[b]
+        if bucket is None:
+            self.buckets[b] = {i}
+        else:
+            bucket.add(i)
+        return
+
+# Main program.
+def runMe():
+    # Placeholder.
+    return
+
+if __name__ == '__main__':
+    runMe()
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+Streaming readers for numeric input files to be used as an imported module.
+
+The files are read in large chunks, which always end at a line break, and
+every chunk is converted as a whole, so that no list of all lines of the
+file is held in memory.
+
+A method collection for Stanford Algorithms Specialization 2 written
+by Oliver Kroneisen, oliver@kroneisen.net
+"""
+
+from array import array
+from itertools import chain, compress, cycle, islice, repeat
+from operator import itemgetter, sub
+
+global CHUNK
+CHUNK = 1 << 20   # number of characters per chunk
+
+def read_chunks(file_name, skip=0, size=None):
+    """
+    Read text file in chunks ending at line breaks.
+
+    Arguments:
+        file_name (str):
+            File name to be read.
+        skip (int):
+            Optional number of header lines to be skipped.
+        size (int):
+            Optional number of characters per chunk, 'None' for the default
+            CHUNK.
+
+    Returns:
+        chunk (str):
+            Generator of chunks of complete lines.
+    """
+
+    global CHUNK
+    if size is None:
+        size = CHUNK
+    with open(file_name, 'r') as f:
+        for i in range(skip):
+            f.readline()
+        while True:
+            chunk = f.read(size)
+            if not chunk:
+                break
+            if chunk[-1] != '\n':
+                # Complete the last line of the chunk.
+                chunk += f.readline()
+            yield chunk
+    return
+
+def read_ints(file_name, typecode='q', skip=0, sep=None):
+    """
+    Read all integer numbers of a text file into one flat array.
+
+    Arguments:
+        file_name (str):
+            File name to be read.
+        typecode (str):
+            Optional typecode of the array, signed 64 bit integer 'q' by
+            default.
+        skip (int):
+            Optional number of header lines to be skipped.
+        sep (str):
+            Optional separator to be treated like whitespace, e.g. ','.
+
+    Returns:
+        a (array):
+            Array of all numbers in the order of the file.
+    """
+
+    a = array(typecode)
+    for chunk in read_chunks(file_name, skip):
+        if sep is not None:
+            chunk = chunk.replace(sep, ' ')
+        a.extend(map(int, chunk.split()))
+    return a
+
+def read_columns(file_name, k, typecode='q', skip=0):
+    """
+    Read text file with k integer numbers per line into k arrays.
+
+    Arguments:
+        file_name (str):
+            File name to be read.
+        k (int):
+            Number of columns.
+        typecode (str):
+            Optional typecode of the arrays, signed 64 bit integer 'q' by
+            default.
+        skip (int):
+            Optional number of header lines to be skipped.
+
+    Returns:
+        columns (list):
+            List of k arrays, one per column.
+    """
+
+    a = read_ints(file_name, typecode, skip)
+    if len(a) % k:
+        msg = 'Error in read_columns: Number of values does not fit to ' \
+              + str(k) + ' columns.'
+        raise ValueError(msg)
+    columns = [a[j::k] for j in range(k)]
+    return columns
+
+def read_rows(file_name, skip=0, sep=None):
+    """
+    Read text file with a varying number of integer numbers per line, e.g.
+    adjacency lists.
+
+    Arguments:
+        file_name (str):
+            File name to be read.
+        skip (int):
+            Optional number of header lines to be skipped.
+        sep (str):
+            Optional separator to be treated like whitespace, e.g. ','.
+
+    Returns:
+        row (list):
+            Generator of lists of the numbers per line, empty lines are
+            skipped.
+    """
+
+    for chunk in read_chunks(file_name, skip):
+        if sep is not None:
+            chunk = chunk.replace(sep, ' ')
+        for line in chunk.splitlines():
+            row = list(map(int, line.split()))
+            if row:
+                yield row
+    return
+
+def read_adjacency(file_name, skip=0, sep=None):
+    """
+    Read text file of adjacency lists, where every line starts with a node
+    followed by a varying number of values, e.g. head nodes, into flat
+    arrays.
+
+    Arguments:
+        file_name (str):
+            File name to be read.
+        skip (int):
+            Optional number of header lines to be skipped.
+        sep (str):
+            Optional separator to be treated like whitespace, e.g. ','.
+
+    Returns:
+        nodes (array):
+            First number per line.
+        tails (array):
+            First number of the line per value, i.e. tails[k] is the node
+            of the line containing values[k].
+        values (array):
+            All remaining numbers per line in the order of the file.
+    """
+
+    nodes, tails, values = array('q'), array('q'), array('q')
+    for chunk in read_chunks(file_name, skip):
+        if sep is not None:
+            chunk = chunk.replace(sep, ' ')
+        lines = chunk.splitlines()
+        # Count the numbers per line.
+        counts = array('q', map(len, map(str.split, lines)))
+        w = max(counts, default=0)
+        k = len(nodes)
+        if w and counts.count(w) == len(counts):
+            # Same number of values on every line, e.g. an edge list, so
+            # the chunk can be converted as a whole.
+            numbers = array('q', map(int, chunk.split()))
+            nodes.extend(numbers[0::w])
+            if w == 2:
+                tails.extend(numbers[0::2])
+                values.extend(numbers[1::2])
+            else:
+                tails.extend(chain.from_iterable(
+                    map(repeat, nodes[k:], repeat(w - 1))))
+                values.extend(compress(numbers, cycle([0] + [1] * (w - 1))))
+        else:
+            rows = list(filter(None, map(str.split, lines)))
+            nodes.extend(map(int, map(itemgetter(0), rows)))
+            counts = map(sub, map(len, rows), repeat(1))
+            tails.extend(chain.from_iterable(
+                map(repeat, nodes[k:], counts)))
+            values.extend(map(int, chain.from_iterable(
+                map(islice, rows, repeat(1), repeat(None)))))
+    return nodes, tails, values
@@ -11,6 +11,7 @@ import time, copy
 class Elem:
     """
     Class to represent elements to be sorted.
+    The attributes are declared as slots to save memory.
     
     Attributes:
         key (int): key value for sorting, does not have to be unique
@@ -18,6 +19,8 @@ class Elem:
         index (int): index of element, e.g. in an array
     """
 
+    __slots__ = ('key', 'label', 'index', 'index2')
+
     def __init__(self, key, label, index, index2):
         self.key = key         # key or value of the element
         self.label = label     # label of the element
@@ -12,6 +12,7 @@ https://www.coursera.org/learn/algorithms-graphs-data-structures/home/module/4
 
 import time
 import sys
+from algorithms_galore import readers as rd
 
 # Prime numbers for hashing.
 # Suitable prime numbers can be found via the Miller-Rabin test.
@@ -82,23 +83,16 @@ def read_list(file_name):
     Returns:
         status (int):
             '0' indicates successful processing, '1' that an error ocurred.
-        numbers (list):
-            List of numbers.
+        numbers (array):
+            Array of numbers.
     """
 
     # Initialize structures.
     numbers = []
-    # Read list data from file.
+    # Read list data from file in chunks.
     # Each row represents one number of the list.
     try:
-        with open(file_name, 'r') as f:
-            # Read data from file.
-            raw_data = f.readlines()
-            n = len(raw_data)
-            # Evaluate all lines.
-            for i in range(n):   # line number
-                # Evaluate current line.
-                numbers.append(int(raw_data[i]))
+        numbers = rd.read_ints(file_name)
         return 0, numbers
     except:
         return 1, numbers
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark for shortest path queries with contraction hierarchies.
+
+A random road like graph, i.e. a grid of nodes with arcs in both directions
+between neighbours, is written to a file in the format of dijkstraData.txt
+and read back by read_list. The contraction hierarchy is built, written to
+a binary file and loaded again, and random queries are answered by it and
+by bidirectional Dijkstra to be compared.
+
+Usage:
+    python bench_ch.py [grid size] [queries]
+
+A program for Stanford Algorithms Specialization 2 written by Oliver Kroneisen,
+oliver@kroneisen.net
+"""
+
+import os
+import random as rd
+import time
+import sys
+from algorithms_galore.graphs import ch
+from algorithms_galore.graphs import csr as cs
+from algorithms_galore.graphs import dijkstra as dj
+
+def write_grid(file_name, k, wmax=100):
+    """
+    Write random grid graph to file in the format of dijkstraData.txt.
+    The nodes 1, ..., k*k are arranged in k rows of k nodes, every node is
+    connected to its horizontal and vertical neighbours by two arcs of the
+    same weight.
+
+    Arguments:
+        file_name (str):
+            File name for the data to be written.
+        k (int):
+            Number of rows and columns.
+        wmax (int):
+            Maximum weight of an edge, weights are drawn from 1, ..., wmax.
+
+    Returns:
+        err (int):
+            Indicator 0 for success and 1 for errors.
+    """
+
+    try:
+        rows = {i: [] for i in range(1, k*k + 1)}
+        for i in range(1, k*k + 1):
+            heads = []
+            if i % k:
+                heads.append(i + 1)   # right neighbour
+            if i <= k*(k - 1):
+                heads.append(i + k)   # lower neighbour
+            for j in heads:
+                w = str(rd.randint(1, wmax))
+                rows[i].append(str(j) + ',' + w)
+                rows[j].append(str(i) + ',' + w)
+        with open(file_name, 'w') as f:
+            for i, row in rows.items():
+                f.write('\t'.join([str(i)] + row) + '\n')
+        return 0
+    except:
+        return 1
+
+# Main programm
+def runMe():
+    k = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    file_name = 'chBench.txt'
+    ch_name = 'chBench.ch'
+
+    rd.seed(42)
+    sys.stdout.write('\nWriting random grid graph: ' + str(k*k) + ' nodes.\n')
+    sys.stdout.flush()
+    if write_grid(file_name, k):
+        sys.stdout.write('Error writing input data, stop.\n')
+        sys.stdout.flush()
+        return
+    status, nodes, adj_dict = dj.read_list(file_name)
+    os.remove(file_name)
+    if status:   # error in reading the input file
+        sys.stdout.write('Error reading input data, stop.\n')
+        sys.stdout.flush()
+        return
+    g = cs.csr_from_dict(adj_dict)
+    tic = time.perf_counter()
+    c = ch.contract(g)
+    toc = time.perf_counter()
+    sys.stdout.write(str(c) + '\n')
+    sys.stdout.write('Preprocessing: {0:.1f} s\n'.format(toc - tic))
+    sys.stdout.flush()
+    ch.write_ch(c, ch_name)
+    c = ch.load_ch(ch_name)
+    pairs = [(rd.randrange(g.n), rd.randrange(g.n)) for _ in range(queries)]
+    st = dj.bidir_state(g)
+    sys.stdout.write('\nMethod          Time [ms/query]  Checksum\n')
+    sys.stdout.flush()
+    methods = [('dijkstra_bidir',
+                lambda s, t: dj.dijkstra_bidir(g, s, t, st=st)),
+               ('ch.query', c.query),
+               ('ch.query dist', lambda s, t: c.query(s, t, unpack=False))]
+    for name, query in methods:
+        tic = time.perf_counter()
+        checksum = sum(query(s, t)[0] for s, t in pairs)
+        toc = time.perf_counter()
+        sys.stdout.write('{0:14s}  {1:15.3f}  {2}\n'.format(
+            name, (toc - tic) * 1000 / queries, checksum))
+        sys.stdout.flush()
+    del c
+    os.remove(ch_name)
+    return
+
+if __name__ == '__main__':
+    runMe()
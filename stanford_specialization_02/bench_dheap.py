@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark for Dijkstra's algorithm with d-ary heaps of different arity.
+
+A random directed graph in the format of dijkstraData.txt is written to
+a file, read back and the shortest paths from node 1 are calculated with
+dijkstra_paths for every arity to be compared.
+
+Usage:
+    python bench_dheap.py [nodes] [edges] [arity, ...]
+
+A program for Stanford Algorithms Specialization 2 written by Oliver Kroneisen,
+oliver@kroneisen.net
+"""
+
+import math
+import random as rd
+import time
+import sys
+from algorithms_galore.graphs import dijkstra as dj
+
+def write_graph(file_name, n, m, wmax=1000):
+    """
+    Write random directed graph to file in the format of dijkstraData.txt.
+    Every row starts with the tail node of an arc, followed by tuples
+    node,weight for the heads of the arcs.
+    The nodes 1, ..., n are connected by a cycle, so that all nodes are
+    reachable from node 1.
+
+    Arguments:
+        file_name (str):
+            File name for the data to be written.
+        n (int):
+            Number of nodes.
+        m (int):
+            Number of arcs, at least n.
+        wmax (int):
+            Maximum weight of an arc, weights are drawn from 1, ..., wmax.
+
+    Returns:
+        err (int):
+            Indicator 0 for success and 1 for errors.
+    """
+
+    try:
+        with open(file_name, 'w') as f:
+            for i in range(1, n + 1):
+                # Arc of the cycle plus random arcs, m arcs in total.
+                k = m//n + (1 if i <= m % n else 0)
+                heads = [i % n + 1]
+                heads += [rd.randint(1, n) for _ in range(k - 1)]
+                row = [str(i)]
+                for j in heads:
+                    row.append(str(j) + ',' + str(rd.randint(1, wmax)))
+                f.write('\t'.join(row) + '\n')
+        return 0
+    except:
+        return 1
+
+# Main programm
+def runMe():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else 2000000
+    arities = [int(a) for a in sys.argv[3:]] or [2, 3, 4, 8, 16]
+    file_name = 'dijkstraBench.txt'
+
+    rd.seed(42)
+    sys.stdout.write('\nWriting random graph: ' + str(n) + ' nodes, ')
+    sys.stdout.write(str(m) + ' arcs.\n')
+    sys.stdout.flush()
+    if write_graph(file_name, n, m):
+        sys.stdout.write('Error writing input data, stop.\n')
+        sys.stdout.flush()
+        return
+    status, nodes, adj_dict = dj.read_list(file_name)
+    if status:   # error in reading the input file
+        sys.stdout.write('Error reading input data, stop.\n')
+        sys.stdout.flush()
+        return
+    sys.stdout.write('\nArity  Time [ms]  Checksum\n')
+    sys.stdout.flush()
+    for arity in arities:
+        # Reset nodes before every run.
+        for e in nodes.values():
+            e.val, e.idx, e.ref = math.inf, -1, -1
+        tic = time.perf_counter()
+        dj.dijkstra_paths(nodes, adj_dict, nodes[1], arity=arity)
+        toc = time.perf_counter()
+        checksum = sum(e.val for e in nodes.values())
+        sys.stdout.write('{0:5d}  {1:9.1f}  {2}\n'.format(
+            arity, (toc - tic) * 1000, checksum))
+        sys.stdout.flush()
+    return
+
+if __name__ == '__main__':
+    runMe()
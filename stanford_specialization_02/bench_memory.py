@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark for the memory consumption of graph nodes and tree nodes.
+
+Reports the bytes per node for a dictionary of n node elements of class elem,
+as created by the graph readers, and for an AVL tree of n keys built from
+nodes of class bnode.
+
+Usage:
+    python bench_memory.py [n]
+
+A program for Stanford Algorithms Specialization 2 written by Oliver Kroneisen,
+oliver@kroneisen.net
+"""
+
+import random as rd
+import tracemalloc
+import sys
+import bnodes as bn
+import treetools as tt
+from algorithms_galore import elements as el
+
+def graph_nodes(n):
+    """
+    Create dictionary of n node elements, as created by the graph readers.
+
+    Arguments:
+        n (int):
+            Number of nodes.
+
+    Returns:
+        nodes (dict):
+            Dictionary of nodes, matching every node key to the node element.
+    """
+
+    nodes = {}
+    for i in range(1, n + 1):
+        nodes[i] = el.elem(i, 1000000, -1)
+    return nodes
+
+def avl_tree(n):
+    """
+    Create AVL tree of n random keys.
+
+    Arguments:
+        n (int):
+            Number of keys.
+
+    Returns:
+        t (btree):
+            AVL tree of n nodes.
+    """
+
+    t = tt.btree(tree_type='avl')
+    for i in range(n):
+        t.insert(bn.bnode(rd.randint(0, 10*n)), unique=False)
+    return t
+
+def measure(create, n):
+    """
+    Measure memory allocated for a structure with n nodes.
+
+    Arguments:
+        create (function):
+            Function creating the structure for n nodes.
+        n (int):
+            Number of nodes.
+
+    Returns:
+        size (float):
+            Number of bytes per node.
+    """
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    structure = create(n)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del structure
+    return (after - before) / n
+
+# Main programm
+def runMe():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    rd.seed(42)
+    sys.stdout.write('\nMemory per node for ' + str(n) + ' nodes.\n')
+    sys.stdout.flush()
+    size = measure(graph_nodes, n)
+    sys.stdout.write('Graph nodes (elem):    {0:6.1f} bytes\n'.format(size))
+    sys.stdout.flush()
+    size = measure(avl_tree, n)
+    sys.stdout.write('AVL tree (bnode):      {0:6.1f} bytes\n'.format(size))
+    sys.stdout.flush()
+    return
+
+if __name__ == '__main__':
+    runMe()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark for Dijkstra's algorithm with different priority queues.
+
+A random directed graph in the format of dijkstraData.txt is written to
+a file, read back and the shortest paths from node 1 are calculated with
+the binary heap (dijkstra_paths), the indexed heap, the pairing heap and
+the bucket queue (dijkstra_paths_indexed) and the lazy heap
+(dijkstra_paths_lazy).
+
+Usage:
+    python bench_pq.py [nodes] [edges]
+
+A program for Stanford Algorithms Specialization 2 written by Oliver Kroneisen,
+oliver@kroneisen.net
+"""
+
+import math
+import random as rd
+import time
+import sys
+from bench_dheap import write_graph
+from algorithms_galore import heaps as ht
+from algorithms_galore.graphs import dijkstra as dj
+
+# Main programm
+def runMe():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else 1000000
+    file_name = 'dijkstraBench.txt'
+
+    rd.seed(42)
+    sys.stdout.write('\nWriting random graph: ' + str(n) + ' nodes, ')
+    sys.stdout.write(str(m) + ' arcs.\n')
+    sys.stdout.flush()
+    if write_graph(file_name, n, m):
+        sys.stdout.write('Error writing input data, stop.\n')
+        sys.stdout.flush()
+        return
+    status, nodes, adj_dict = dj.read_list(file_name)
+    if status:   # error in reading the input file
+        sys.stdout.write('Error reading input data, stop.\n')
+        sys.stdout.flush()
+        return
+    runs = [
+        ('heap', lambda s: dj.dijkstra_paths(nodes, adj_dict, s)),
+        ('iheap', lambda s: dj.dijkstra_paths_indexed(nodes, adj_dict, s,
+                                                       pq=ht.iheap)),
+        ('pheap', lambda s: dj.dijkstra_paths_indexed(nodes, adj_dict, s,
+                                                       pq=ht.pheap)),
+        ('bqueue', lambda s: dj.dijkstra_paths_indexed(nodes, adj_dict, s)),
+        ('lazy heap', lambda s: dj.dijkstra_paths_lazy(nodes, adj_dict, s)),
+    ]
+    sys.stdout.write('\nPriority queue  Time [ms]  Checksum\n')
+    sys.stdout.flush()
+    for name, run in runs:
+        # Reset nodes before every run.
+        for e in nodes.values():
+            e.val, e.idx, e.ref = math.inf, -1, -1
+        tic = time.perf_counter()
+        run(nodes[1])
+        toc = time.perf_counter()
+        checksum = sum(e.val for e in nodes.values())
+        sys.stdout.write('{0:14s}  {1:9.1f}  {2}\n'.format(
+            name, (toc - tic) * 1000, checksum))
+        sys.stdout.flush()
+    return
+
+if __name__ == '__main__':
+    runMe()
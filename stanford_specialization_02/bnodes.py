@@ -17,6 +17,8 @@ class bnode:
     of the subtree for this node, when part of a binary tree.
     This attribute is calculated automatically when the configuration
     the node is in has changed.
+    All attributes are declared as slots, so that the nodes need no
+    per-instance dictionary.
     
     Attention: if the attribute parent is set, then the new node will
     also have self.parent = parent. However, the parent node will not be
@@ -38,6 +40,9 @@ class bnode:
             in case no right child exists.
     """
 
+    __slots__ = ('key', 'mark', 'parent', 'left', 'right',
+                 'size', 'height', 'balance')
+
     def __init__(self, key, mark=None, parent=None, left=None, right=None):
         """
         Initialize bnode.
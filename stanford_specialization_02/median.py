@@ -9,11 +9,12 @@ This program is related to the programming assignment #3 in the Course
 https://www.coursera.org/learn/algorithms-graphs-data-structures/home/module/3
 """
 
-import heaptools as ht
 import bnodes as bn
 import treetools as tt
 import time
 import sys
+from algorithms_galore import heaps as ht
+from algorithms_galore import readers as rd
 
 def medians_by_heap(numbers):
     """
@@ -29,8 +30,8 @@ def medians_by_heap(numbers):
     the N/2-th number).
 
     Arguments:
-        numbers (list):
-            List of numbers.
+        numbers (array):
+            Array of numbers.
 
     Returns:
         checksum (int):
@@ -48,37 +49,24 @@ def medians_by_heap(numbers):
     # Process stream of numbers.
     for i in numbers:
         len_lo, len_hi = len(lo.e), len(hi.e)
-        # Add number i to the correct heap.
+        # Add number i to the correct heap, keeping the heaps balanced.
         if len_hi == 0 or i <= hi.e[0]:
             # Number can be added to heap lo.
             if len_lo <= len_hi:
                 # Add number to lo, which is also okay for the balance.
                 lo.insert(i)
-                len_lo += 1
             else:
-                # Heap lo must contain at least 1 number.
-                if i >= lo.e[0]:
-                    # Number can also be added to heap hi.
-                    # We will add to heap hi, to maintain balance.
-                    hi.insert(i)
-                    len_hi += 1
-                else:
-                    # Number must be added to heap lo.
-                    lo.insert(i)
-                    len_lo += 1
+                # Add number to lo and shift maximum of lo to heap hi,
+                # which is number i itself, if i >= maximum of lo.
+                hi.insert(lo.pushpop(i))
         else:
             # Number must be added to heap hi.
-            hi.insert(i)
-            len_hi += 1
-        # Rebalance heaps if necessary.
-        if len_lo > len_hi + 1:
-            # Shift maximum from heap lo to heap hi.
-            m = lo.deletem()
-            hi.insert(m)
-        elif len_lo < len_hi:
-            # Shift minimum from heap hi to heap lo.
-            m = hi.deletem()
-            lo.insert(m)
+            if len_hi < len_lo:
+                # Add number to hi, which is also okay for the balance.
+                hi.insert(i)
+            else:
+                # Add number to hi and shift minimum of hi to heap lo.
+                lo.insert(hi.pushpop(i))
         # Get current median from heap lo.
         median = lo.e[0]
         #print('Median =', median)
@@ -136,17 +124,10 @@ def read_list(file_name):
 
     # Initialize structures.
     numbers = []
-    # Read list data from file.
+    # Read list data from file in chunks.
     # Each row represents one number of the list.
     try:
-        with open(file_name, 'r') as f:
-            # Read data from file.
-            raw_data = f.readlines()
-            n = len(raw_data)
-            # Evaluate all lines.
-            for i in range(n):   # line number
-                # Evaluate current line.
-                numbers.append(int(raw_data[i]))
+        numbers = rd.read_ints(file_name)
         return 0, numbers
     except:
         return 1, numbers
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Test for CSR graph class and the graph algorithms working on it.
+
+A program for Stanford Algorithms Specialization 2 written by Oliver Kroneisen,
+oliver@kroneisen.net
+"""
+
+import os
+from algorithms_galore.graphs import ch
+from algorithms_galore.graphs import csr as cs
+from algorithms_galore.graphs import dijkstra as dj
+from algorithms_galore.graphs import prim as pr
+from algorithms_galore.graphs import scc
+
+# Main programm
+def runMe():
+    # Test 01.
+    print('Testsatz 1')
+    tails = [1, 1, 2, 3, 3, 5, 7]
+    heads = [2, 3, 5, 2, 5, 7, 5]
+    weights = [4, 1, 3, 2, 7, 1, 2]
+    g = cs.csr_from_edges(tails, heads, weights)
+    print(g)
+    for i in range(len(g)):
+        print(g.keys[i], '->', [(g.keys[j], w) for j, w in g.arcs(i)])
+    gr = g.transpose()
+    print('transpose ->', gr)
+    for i in range(len(gr)):
+        print(gr.keys[i], '->', [(gr.keys[j], w) for j, w in gr.arcs(i)])
+    # Test 02.
+    print('Testsatz 2')
+    dist, pred = dj.dijkstra_csr(g, g.index(1))
+    for i in range(len(g)):
+        p = g.keys[pred[i]] if pred[i] > -1 else None
+        print('node', g.keys[i], 'dist', dist[i], 'pred', p)
+    # Test 03.
+    print('Testsatz 3')
+    g = cs.csr_from_edges(tails, heads, weights, undirected=True)
+    cost, T = pr.prim_csr(g, g.index(1))
+    print('cost ->', cost)
+    print('tree ->', T)
+    # Test 04.
+    print('Testsatz 4')
+    g = cs.csr_from_edges(tails, heads, keys=range(1, 9))
+    leader = scc.kosaraju_csr(g)
+    for i in range(len(g)):
+        print('node', g.keys[i], 'leader', g.keys[leader[i]])
+    # Test 05.
+    print('Testsatz 5')
+    g = cs.csr_from_edges(tails, heads, weights)
+    file_name = 'testCSR.csr'
+    err = cs.write_csr(g, file_name)
+    print('write_csr ->', err)
+    g = cs.load_csr(file_name)
+    print('load_csr ->', g)
+    for i in range(len(g)):
+        print(g.keys[i], '->', [(g.keys[j], w) for j, w in g.arcs(i)])
+    dist, pred = dj.dijkstra_csr(g, g.index(1))
+    print('dist ->', list(dist))
+    del g
+    os.remove(file_name)
+    # Test 06.
+    print('Testsatz 6')
+    g = cs.csr_from_edges(tails, heads, keys=range(1, 9))
+    comp, sizes = scc.tarjan_csr(g)
+    for i in range(len(g)):
+        print('node', g.keys[i], 'component', comp[i])
+    print('sizes ->', list(sizes))
+    # Test 07.
+    print('Testsatz 7')
+    comp, sizes = scc.components_csr(scc.kosaraju_csr(g))
+    print('components ->', list(comp))
+    print('sizes ->', list(sizes))
+    dag = scc.condensation(g, comp, len(sizes))
+    print('condensation ->', dag)
+    for c in range(len(dag)):
+        print(c, '->', [d for d, _ in dag.arcs(c)])
+    # Test 08.
+    print('Testsatz 8')
+    g = cs.csr_from_edges(tails, heads, weights)
+    s, t = g.index(1), g.index(7)
+    dist, pred = dj.dijkstra_csr(g, s, targets=[t])
+    print('dijkstra_csr, targets', [7], '->', dist[t])
+    d, path = dj.dijkstra_bidir(g, s, t, g.transpose())
+    print('dijkstra_bidir', 1, 7, '->', d, [g.keys[i] for i in path])
+    # Test 09.
+    print('Testsatz 9')
+    a = dj.alt(g, k=2)
+    print('landmarks ->', [g.keys[i] for i in a.landmarks])
+    d, path = dj.astar_csr(g, s, t, a.heuristic(t))
+    print('astar_csr', 1, 7, '->', d, [g.keys[i] for i in path])
+    # Test 10.
+    print('Testsatz 10')
+    c = ch.contract(g)
+    print(c)
+    print('ranks ->', [(g.keys[i], c.rank[i]) for i in range(len(c))])
+    file_name = 'testCH.ch'
+    err = ch.write_ch(c, file_name)
+    print('write_ch ->', err)
+    c = ch.load_ch(file_name)
+    print('load_ch ->', c)
+    d, path = c.query(s, t)
+    print('query', 1, 7, '->', d, [g.keys[i] for i in path])
+    del c
+    os.remove(file_name)
+    # Test 11.
+    print('Testsatz 11')
+    dist, pred = dj.dijkstra_csr(g, s)
+    print('path', 1, 7, '->', dj.path(pred, t, g.keys))
+    tails, heads = dj.tree_edges(pred, g.keys)
+    print('tree ->', list(zip(tails, heads)))
+    return
+
+if __name__ == '__main__':
+    runMe()
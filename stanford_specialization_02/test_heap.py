@@ -6,11 +6,8 @@ A program for Stanford Algorithms Specialization 2 written by Oliver Kroneisen,
 oliver@kroneisen.net
 """
 
-import elements as el
-import heaptools as ht
-
-global INF   # global variable to represent "infinite"
-INF = 1000000 
+from algorithms_galore import elements as el
+from algorithms_galore import heaps as ht
 
 # Main programm
 def runMe():
@@ -96,6 +93,63 @@ def runMe():
     h.insert(e10, update_idx=True)
     print('insert ->', e10.val)
     print(h)
+    # Test 04.
+    print('Testsatz 4')
+    h = ht.iheap(8)
+    for i, k in enumerate([18, 7, 11, 5, 20, 25]):
+        h.insert(i, k)
+        print('insert ->', i, k)
+    print(h)
+    h.decrease_key(5, 1)
+    print('decrease_key ->', 5, 1)
+    print(h)
+    h.increase_key(3, 30)
+    print('increase_key ->', 3, 30)
+    print(h)
+    k = h.delete(2)
+    print('delete id', 2, '->', k)
+    print(h)
+    while len(h):
+        m = h.deletem()
+        print('deletem ->', m)
+    print(h)
+    # Test 05.
+    print('Testsatz 5')
+    h = ht.heap([18, 7, 11])
+    print(h)
+    h.insert_many([5, 20, 25, 3, 9])
+    print('insert_many ->', [5, 20, 25, 3, 9])
+    print(h)
+    m = h.pushpop(4)
+    print('pushpop', 4, '->', m)
+    print(h)
+    m = h.replace(30)
+    print('replace', 30, '->', m)
+    print(h)
+    print('nsmallest', 3, '->', list(h.nsmallest(3)))
+    print(h)
+    print('drain ->', list(h.drain()))
+    print(h)
+    # Test 06.
+    print('Testsatz 6')
+    h = ht.pheap(8)
+    for i, k in enumerate([18, 7, 11, 5]):
+        h.insert(i, k)
+        print('insert ->', i, k)
+    g = ht.pheap(8)
+    for i, k in [(4, 20), (5, 25)]:
+        g.insert(i, k)
+    h.meld(g)
+    print('meld ->', g)
+    print(h)
+    h.decrease_key(5, 1)
+    print('decrease_key ->', 5, 1)
+    k = h.delete(2)
+    print('delete id', 2, '->', k)
+    while len(h):
+        m = h.deletem()
+        print('deletem ->', m)
+    print(h)
     return
 
 if __name__ == '__main__':
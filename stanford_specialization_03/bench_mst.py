@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark for minimum spanning trees by Prim's and Kruskal's algorithms.
+
+A random connected undirected graph in the format of edges.txt is written
+to a file and read back, and the minimum spanning tree is calculated by
+every method to be compared. The time for reading the input is not
+included.
+
+Usage:
+    python bench_mst.py [nodes] [edges]
+
+A program for Stanford Algorithms Specialization 3 written by Oliver Kroneisen,
+oliver@kroneisen.net
+"""
+
+import math
+import os
+import random as rd
+import time
+import sys
+from algorithms_galore.graphs import kruskal as kr
+from algorithms_galore.graphs import prim as pr
+
+def write_graph(file_name, n, m, wmax=10000):
+    """
+    Write random undirected graph to file in the format of edges.txt.
+    The first row holds the number of nodes and edges, every further row
+    an edge given by two nodes and a weight.
+    The nodes 1, ..., n are connected by a path, so that the graph is
+    connected.
+
+    Arguments:
+        file_name (str):
+            File name for the data to be written.
+        n (int):
+            Number of nodes.
+        m (int):
+            Number of edges, at least n - 1.
+        wmax (int):
+            Maximum absolute weight of an edge, weights are drawn from
+            -wmax, ..., wmax.
+
+    Returns:
+        err (int):
+            Indicator 0 for success and 1 for errors.
+    """
+
+    try:
+        with open(file_name, 'w') as f:
+            f.write(str(n) + ' ' + str(m) + '\n')
+            for k in range(m):
+                if k < n - 1:   # edge of the path
+                    u, v = k + 1, k + 2
+                else:
+                    u, v = rd.randint(1, n), rd.randint(1, n)
+                w = rd.randint(-wmax, wmax)
+                f.write(str(u) + ' ' + str(v) + ' ' + str(w) + '\n')
+        return 0
+    except:
+        return 1
+
+# Main programm
+def runMe():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else 1000000
+    file_name = 'mstBench.txt'
+
+    rd.seed(42)
+    sys.stdout.write('\nWriting random graph: ' + str(n) + ' nodes, ')
+    sys.stdout.write(str(m) + ' edges.\n')
+    sys.stdout.flush()
+    if write_graph(file_name, n, m):
+        sys.stdout.write('Error writing input data, stop.\n')
+        sys.stdout.flush()
+        return
+    status, nodes, adj_dict = pr.read_list(file_name)
+    status_csr, g = pr.read_csr(file_name)
+    status_kr, tails, heads, weights = kr.read_list(file_name)
+    os.remove(file_name)
+    if status or status_csr or status_kr:   # error in reading input file
+        sys.stdout.write('Error reading input data, stop.\n')
+        sys.stdout.flush()
+        return
+    methods = [
+        ('prim_MST', lambda: pr.prim_MST(nodes, adj_dict, nodes[1])),
+        ('prim_MST_indexed',
+         lambda: pr.prim_MST_indexed(nodes, adj_dict, nodes[1])),
+        ('prim_MST_lazy',
+         lambda: pr.prim_MST_lazy(nodes, adj_dict, nodes[1])),
+        ('prim_csr', lambda: pr.prim_csr(g, g.index(1))),
+        ('kruskal_MST', lambda: kr.kruskal_MST(tails, heads, weights)),
+        ('kruskal_csr', lambda: kr.kruskal_csr(g))]
+    sys.stdout.write('\nMethod            Time [ms]  Cost\n')
+    sys.stdout.flush()
+    for name, mst in methods:
+        # Reset nodes before every run.
+        for e in nodes.values():
+            e.val, e.idx, e.ref = math.inf, -1, -1
+        tic = time.perf_counter()
+        cost, T = mst()
+        toc = time.perf_counter()
+        sys.stdout.write('{0:16s}  {1:9.1f}  {2}\n'.format(
+            name, (toc - tic) * 1000, cost))
+        sys.stdout.flush()
+    return
+
+if __name__ == '__main__':
+    runMe()
@@ -12,6 +12,7 @@ class elem:
     
     The attributes of this class are not protected to make handling the
     elements easier, i.e. no setter / getter methods are needed.
+    They are declared as slots to keep the elements small.
 
     Arguments:
         key (int):
@@ -26,6 +27,8 @@ class elem:
             Reference to the key of another element (optional).
     """
 
+    __slots__ = ('key', 'weight', 'length', 'val', 'idx', 'ref')
+
     def __init__(self, key, weight, length, val, idx, ref=-1):
         """
         Initialize element.
@@ -15,7 +15,7 @@ https://www.coursera.org/learn/algorithms-greedy/home/module/1
 import time
 import sys
 import elements_adjusted as el
-import heaptools         as ht
+from algorithms_galore import heaps as ht
 
 def read_list(file_name):
     """
@@ -74,24 +74,19 @@ def runMe():
     sys.stdout.write('No. of jobs: ' + str(len(jobs)) + '\n')
     sys.stdout.flush()
     # Create heap for jobs.
-    h = ht.heap(jobs, mintype=False, update_idx=True)   # maximum heap
+    # The sort key (val, weight) reproduces the lt / gt relation of
+    # elements_adjusted, i.e. ties on val are broken by weight.
+    h = ht.kheap(jobs, lambda job: (job.val, job.weight), mintype=False)
     # Schedule jobs and update weighted sum.
     sys.stdout.write('\nCalculate schedule.\n')
     sys.stdout.flush()
     wsum = 0
     tfin = 0
-    stop = False
-    while not stop:
-        # Identify next job.
-        try:
-            job = h.deletem(update_idx=True)
-            #print('Schedule', job.key, job.weight, job.length, '->', job.val)
-            # Update wsum.
-            tfin += job.length
-            wsum += job.weight*tfin
-        except:
-            # No more jobs to schedule.
-            stop = True
+    for job in h.drain():   # next job until no more jobs to schedule
+        #print('Schedule', job.key, job.weight, job.length, '->', job.val)
+        # Update wsum.
+        tfin += job.length
+        wsum += job.weight*tfin
     # Weighted sum accoridng to assignement.
     sys.stdout.write('\nWeighted sum: ' + str(wsum) + '\n')
     sys.stdout.flush()
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Kruskal's greedy algorithm for calculating a minimal spanning tree in an
+undirected graph with weigthed edges (weights can also be negative).
+
+Runtime: O(m log m) for a Graph with m edges and n vertices.
+
+A program for Stanford Algorithms Specialization 3 written by Oliver Kroneisen,
+oliver@kroneisen.net
+
+This program is related to the programming assignment #1 in the Course
+https://www.coursera.org/learn/algorithms-greedy/home/module/1
+as an alternative to prim.py.
+"""
+
+import time
+import sys
+from algorithms_galore.graphs import kruskal as kr
+
+# Main programm
+def runMe():
+    file_name = 'edges.txt'
+
+    tic = time.perf_counter()
+    sys.stdout.write('\nReading input data for Kruskal.\n')
+    sys.stdout.flush()
+    status, tails, heads, weights = kr.read_list(file_name)
+    if status:   # error in reading the input file
+        sys.stdout.write('Error reading input data, stop.\n')
+        sys.stdout.flush()
+        return
+    sys.stdout.write('No. of edges: ' + str(len(weights)) + '\n')
+    sys.stdout.flush()
+    sys.stdout.write('\nCalculate minimum spanning tree.\n')
+    sys.stdout.flush()
+    cost, T = kr.kruskal_MST(tails, heads, weights)
+    # Minimum spanning tree according to assignement.
+    sys.stdout.write('\nCost of minimum spanning tree: ' + str(cost) + '\n')
+    sys.stdout.flush()
+    toc = time.perf_counter()
+    print('\nExecution time: {0} ms'.format((toc - tic) * 1000))
+    return
+
+if __name__ == '__main__':
+    runMe()